@@ -0,0 +1,23 @@
+"""
+Shared helpers for the test scripts
+"""
+
+try:
+    # orjson decodes the multi-KB analysis payloads several times faster
+    # than stdlib json; it's optional, so fall back when absent
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+def coerce_body(body):
+    """Return a Lambda response body as a dict
+
+    Handlers sometimes return the body pre-parsed and sometimes as a
+    JSON string; every script repeated the isinstance/json.loads dance.
+    """
+    if isinstance(body, dict):
+        return body
+    if isinstance(body, str):
+        body = body.encode()
+    return _loads(body)
@@ -0,0 +1,16 @@
+"""
+Shared sys.path bootstrap for scripts that import from src/
+
+Each script used to rebuild the ../src path itself - some relative to
+the working directory, which broke when invoked from anywhere but the
+repo root. Importing this module inserts the absolute src directory
+once and is idempotent, so src modules resolve the same way no matter
+which script (or how many) loaded first.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC = str(Path(__file__).resolve().parent.parent / 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared disk cache for CloudFormation stack outputs
+
+Back-to-back helper runs (get_bucket_names.py && open_web_ui.py) each
+paid their own DescribeStacks round-trip for values that change only on
+deploy. Outputs are cached under ~/.cache/ats-buddy with a short TTL so
+multi-script workflows make at most one CloudFormation call.
+"""
+
+import json
+import time
+from pathlib import Path
+
+CACHE_PATH = Path.home() / '.cache' / 'ats-buddy' / 'stack-outputs.json'
+CACHE_TTL_SECONDS = 300
+
+
+def _read_cache():
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def store_outputs(stack_name, outputs):
+    """Record a fresh {OutputKey: OutputValue} dict for later readers"""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        cache = _read_cache()
+        cache[stack_name] = {'fetched_at': time.time(), 'outputs': outputs}
+        CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
+def get_outputs(stack_name, region=None):
+    """Return stack outputs as a dict, serving from cache within the TTL"""
+    entry = _read_cache().get(stack_name)
+    if entry and time.time() - entry.get('fetched_at', 0) < CACHE_TTL_SECONDS:
+        return entry['outputs']
+
+    # Deferred so cache hits never pay the SDK import; botocore alone
+    # skips boto3's resource layer and loads measurably faster for the
+    # single client call this path needs
+    import botocore.session
+
+    cf = botocore.session.Session().create_client('cloudformation', region_name=region)
+    stack = cf.describe_stacks(StackName=stack_name)['Stacks'][0]
+    outputs = {o['OutputKey']: o['OutputValue'] for o in stack.get('Outputs', [])}
+    store_outputs(stack_name, outputs)
+    return outputs
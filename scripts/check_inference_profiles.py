@@ -5,8 +5,38 @@ Check available Bedrock inference profiles
 
 import boto3
 import json
+import os
+import pickle
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from botocore.exceptions import ClientError
 
+CACHE_DIR = os.path.expanduser('~/.cache/ats-buddy')
+CACHE_TTL_SECONDS = 300
+
+
+def cached(key, ttl, fn):
+    """Cache an API response on disk so repeated runs within ttl skip the network"""
+    path = os.path.join(CACHE_DIR, f'{key}.pkl')
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError):
+        pass
+
+    result = fn()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(result, f)
+    except (OSError, pickle.PickleError):
+        pass
+    return result
+
 def check_inference_profiles():
     """Check available inference profiles"""
     print("🔍 Checking Bedrock Inference Profiles...")
@@ -14,8 +44,11 @@ def check_inference_profiles():
     try:
         bedrock = boto3.client('bedrock')
         
-        # List inference profiles
-        response = bedrock.list_inference_profiles()
+        # List inference profiles (disk-cached across repeated runs)
+        response = cached(
+            'inference-profiles', CACHE_TTL_SECONDS,
+            bedrock.list_inference_profiles
+        )
         
         profiles = response.get('inferenceProfileSummaries', [])
         print(f"✅ Found {len(profiles)} inference profiles")
@@ -44,13 +77,14 @@ def check_inference_profiles():
         print(f"❌ Unexpected error: {e}")
         return []
 
-def test_inference_profile(profile_id):
+def test_inference_profile(profile_id, bedrock=None):
     """Test a specific inference profile"""
     print(f"🧪 Testing inference profile: {profile_id}")
-    
+
     try:
-        bedrock = boto3.client('bedrock-runtime')
-        
+        if bedrock is None:
+            bedrock = boto3.client('bedrock-runtime')
+
         request_body = {
             "messages": [{"role": "user", "content": [{"text": "Hello, respond with 'Connection successful'"}]}],
             "inferenceConfig": {
@@ -84,37 +118,39 @@ def test_inference_profile(profile_id):
         print(f"   ❌ Exception: {e}")
         return False
 
+@lru_cache(maxsize=1)
 def get_current_model():
-    """Get the currently configured model from bedrock_client.py"""
+    """Get the currently configured model from bedrock_client.py (cached)"""
     try:
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        import _path
         from bedrock_client import BedrockClient
-        
+
         client = BedrockClient()
         return client.model_id
     except Exception:
         return None
 
+# Model ranking by capability and cost-effectiveness; the match group index
+# is the rank, so one regex scan replaces a loop of substring checks
+_RANK_RE = re.compile(
+    r'(nova-pro)'            # 1: Most capable
+    r'|(nova-lite)'          # 2: Best balance (recommended)
+    r'|(nova-micro)'         # 3: Fastest/cheapest but less capable
+    r'|(claude-3-5-sonnet)'  # 4: Good but expensive
+    r'|(claude-3-sonnet)'    # 5
+    r'|(claude-3-haiku)',    # 6
+    re.I
+)
+
+
+def get_model_rank(profile_id):
+    """Rank a profile id by model capability (1 = best, 999 = unknown)"""
+    match = _RANK_RE.search(profile_id)
+    return match.lastindex if match else 999
+
+
 def rank_models(working_profiles):
     """Rank models by capability (best to worst)"""
-    # Model ranking by capability and cost-effectiveness
-    model_ranking = {
-        'nova-pro': 1,    # Most capable
-        'nova-lite': 2,   # Best balance (recommended)
-        'nova-micro': 3,  # Fastest/cheapest but less capable
-        'claude-3-5-sonnet': 4,  # Good but expensive
-        'claude-3-sonnet': 5,
-        'claude-3-haiku': 6
-    }
-    
-    def get_model_rank(profile_id):
-        for model_type, rank in model_ranking.items():
-            if model_type in profile_id.lower():
-                return rank
-        return 999  # Unknown models go last
-    
     return sorted(working_profiles, key=get_model_rank)
 
 def main():
@@ -126,7 +162,15 @@ def main():
     current_model = get_current_model()
     if current_model:
         print(f"📋 Current model in bedrock_client.py: {current_model}")
-    
+
+        # Fast path: if the configured model is already top-tier and works,
+        # skip probing every other profile
+        if get_model_rank(current_model) <= 2 and test_inference_profile(current_model):
+            print(f"\n💡 RECOMMENDATION:")
+            print(f"   ✅ Your current model ({current_model}) is excellent!")
+            print(f"   🎯 No changes needed - you're using a top-tier model")
+            return current_model
+
     # Check available profiles
     profiles = check_inference_profiles()
     
@@ -135,13 +179,20 @@ def main():
         print("🔧 You may need to create inference profiles in AWS Console")
         return
     
-    # Test each profile
-    working_profiles = []
-    
-    for profile in profiles:
-        profile_id = profile['inferenceProfileId']
-        if test_inference_profile(profile_id):
-            working_profiles.append(profile_id)
+    # Test all profiles concurrently - the probes are pure network waits,
+    # so wall time drops to the single slowest invocation
+    bedrock_runtime = boto3.client('bedrock-runtime')
+    profile_ids = [profile['inferenceProfileId'] for profile in profiles]
+
+    with ThreadPoolExecutor(max_workers=min(16, len(profile_ids))) as executor:
+        results = list(executor.map(
+            lambda pid: test_inference_profile(pid, bedrock_runtime),
+            profile_ids
+        ))
+
+    working_profiles = [
+        profile_id for profile_id, ok in zip(profile_ids, results) if ok
+    ]
     
     print("\n" + "=" * 50)
     print("🏆 RESULTS")
@@ -4,24 +4,64 @@ Deploy ATS Buddy with CloudFront Distribution (Non-Interactive)
 Complete deployment script that doesn't require user input
 """
 
+import asyncio
 import boto3
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 import time
 import json
+from functools import lru_cache
 from pathlib import Path
+from botocore.config import Config
 
-def run_command(command, cwd=None, interactive=False):
-    """Run shell command and return success status"""
+# Adaptive retry mode paces requests client-side instead of burning wall
+# clock on throttled DescribeStacks retries
+_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'}, connect_timeout=5, read_timeout=20)
+
+# One Session shared by all clients; lru_cache means each service client is
+# constructed once and its HTTPS keep-alive pool is reused across calls
+_SESSION = boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _client(service, region=None):
+    return _SESSION.client(service, region_name=region, config=_CFG)
+
+
+# Single describe_stacks shared by every reader in one deploy phase
+_STACK_CACHE = {}
+
+
+def _describe_stack(stack_name):
+    """Describe a stack once and cache the result for later readers"""
+    if stack_name not in _STACK_CACHE:
+        cf = _client('cloudformation')
+        _STACK_CACHE[stack_name] = cf.describe_stacks(StackName=stack_name)['Stacks'][0]
+    return _STACK_CACHE[stack_name]
+
+def run_command(command, cwd=None, interactive=False, stream=False):
+    """Run shell command and return success status
+
+    stream=True inherits the parent's stdout/stderr so long-running
+    commands like sam build/deploy show progress as it happens instead
+    of buffering their whole output until exit.
+    """
     try:
         print(f"🔧 Running: {command}")
-        
-        if interactive:
-            # For interactive commands, don't capture output
-            result = subprocess.run(command, shell=True, cwd=cwd)
+
+        # shell=False skips the /bin/sh fork + re-parse; the command
+        # strings here are static, so shlex.split is all we need
+        args = shlex.split(command) if isinstance(command, str) else command
+
+        if interactive or stream:
+            # Don't capture output; let it stream to the terminal
+            result = subprocess.run(args, cwd=cwd)
             return result.returncode == 0
         else:
-            result = subprocess.run(command, shell=True, cwd=cwd, capture_output=True, text=True)
+            result = subprocess.run(args, cwd=cwd, capture_output=True, text=True)
             
             if result.returncode == 0:
                 print("✅ Command completed successfully")
@@ -38,39 +78,41 @@ def run_command(command, cwd=None, interactive=False):
         print(f"❌ Error running command: {e}")
         return False
 
+def _check_credentials():
+    """Verify AWS credentials are configured"""
+    try:
+        sts = _client('sts')
+        identity = sts.get_caller_identity()
+        print(f"✅ AWS credentials configured for account: {identity['Account']}")
+        return True
+    except Exception as e:
+        print(f"❌ AWS credentials not configured: {e}")
+        return False
+
+
 def check_prerequisites():
     """Check if required tools are installed"""
     print("🔍 Checking prerequisites...")
-    
-    # Check AWS CLI
-    if not run_command("aws --version"):
+
+    # A PATH lookup proves the CLIs exist without paying ~200-500ms of
+    # subprocess startup per `--version` probe
+    if shutil.which('aws') is None:
         print("❌ AWS CLI not found. Please install AWS CLI and configure credentials.")
         return False
-    
-    # Check SAM CLI
-    if not run_command("sam --version"):
+
+    if shutil.which('sam') is None:
         print("❌ SAM CLI not found. Please install SAM CLI.")
         return False
-    
-    # Check AWS credentials
-    try:
-        sts = boto3.client('sts')
-        identity = sts.get_caller_identity()
-        print(f"✅ AWS credentials configured for account: {identity['Account']}")
-    except Exception as e:
-        print(f"❌ AWS credentials not configured: {e}")
-        return False
-    
-    return True
+
+    return _check_credentials()
 
 def check_existing_stack():
     """Check if stack already exists"""
     try:
-        cf = boto3.client('cloudformation')
-        response = cf.describe_stacks(StackName='ats-buddy-dev')
+        _describe_stack('ats-buddy-dev')
         print("✅ Found existing stack: ats-buddy-dev")
         return True
-    except cf.exceptions.ClientError as e:
+    except _client('cloudformation').exceptions.ClientError as e:
         if 'does not exist' in str(e):
             print("ℹ️  Stack ats-buddy-dev does not exist, will create new")
             return False
@@ -78,22 +120,80 @@ def check_existing_stack():
             print(f"❌ Error checking stack: {e}")
             return None
 
+# Optional event-driven deploy notifications: point the SNS topic at an
+# SQS queue, export both, and the script reacts to stack events as they
+# arrive instead of polling DescribeStacks
+_EVENTS_TOPIC_ARN = os.environ.get('ATS_STACK_EVENTS_TOPIC_ARN')
+_EVENTS_QUEUE_URL = os.environ.get('ATS_STACK_EVENTS_QUEUE_URL')
+
+
+def _wait_for_stack_events(stack_name, timeout=3600):
+    """Consume CloudFormation events from the configured SQS queue
+
+    Returns True on a terminal success status, False on failure, None if
+    nothing conclusive arrived before the timeout (caller falls back to
+    the waiter). Long polling means the call returns the moment the
+    terminal event lands rather than on a polling interval.
+    """
+    sqs = _client('sqs')
+    deadline = time.time() + timeout
+
+    while time.time() < deadline:
+        resp = sqs.receive_message(
+            QueueUrl=_EVENTS_QUEUE_URL,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=20
+        )
+        for message in resp.get('Messages', []):
+            # CloudFormation notifications are key='value' lines inside
+            # the SNS envelope's Message field
+            body = json.loads(message['Body']).get('Message', '')
+            fields = dict(
+                line.split('=', 1) for line in body.splitlines() if '=' in line
+            )
+            sqs.delete_message(
+                QueueUrl=_EVENTS_QUEUE_URL,
+                ReceiptHandle=message['ReceiptHandle']
+            )
+
+            if (fields.get('ResourceType') == "'AWS::CloudFormation::Stack'"
+                    and fields.get('LogicalResourceId') == f"'{stack_name}'"):
+                status = fields.get('ResourceStatus', '').strip("'")
+                if status in ('CREATE_COMPLETE', 'UPDATE_COMPLETE'):
+                    return True
+                if 'ROLLBACK' in status or 'FAILED' in status:
+                    print(f"❌ Stack reached {status}")
+                    return False
+    return None
+
+
+async def _build_and_check_stack(infra_dir):
+    """Run sam build and the stack-existence lookup concurrently
+
+    The build only touches local files and the DescribeStacks call only
+    touches the network, so overlapping them makes this phase cost
+    max(build, lookup) instead of their sum.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(run_command, "sam build", cwd=infra_dir, stream=True),
+        asyncio.to_thread(check_existing_stack)
+    )
+
+
 def deploy_infrastructure():
     """Deploy the SAM infrastructure with CloudFront"""
     print("\n🏗️  Deploying infrastructure with CloudFront...")
-    
+
     infra_dir = Path(__file__).parent.parent / 'infra'
-    
-    # Build SAM application
+
+    # Build SAM application while looking up existing stack state
     print("\n📦 Building SAM application...")
-    if not run_command("sam build", cwd=infra_dir):
+    built, stack_exists = asyncio.run(_build_and_check_stack(infra_dir))
+    if not built:
         return False
-    
-    # Check if stack exists
-    stack_exists = check_existing_stack()
     if stack_exists is None:
         return False
-    
+
     # Deploy based on whether stack exists
     if stack_exists:
         print("\n🔄 Updating existing stack...")
@@ -110,21 +210,52 @@ def deploy_infrastructure():
             "--parameter-overrides Environment=dev BedrockRegion=ap-southeast-1"
         )
     
-    if not run_command(deploy_cmd, cwd=infra_dir):
+    if _EVENTS_TOPIC_ARN:
+        deploy_cmd += f" --notification-arns {_EVENTS_TOPIC_ARN}"
+
+    if not run_command(deploy_cmd, cwd=infra_dir, stream=True):
         return False
-    
+
+    # Prefer event-driven notifications when a topic+queue is wired up;
+    # otherwise poll the stack with a tight 5s waiter so we move on as
+    # soon as it settles, instead of a blind sleep or the default 30s
+    # waiter delay
+    settled = None
+    if _EVENTS_TOPIC_ARN and _EVENTS_QUEUE_URL:
+        print("\n⏳ Waiting for stack events...")
+        settled = _wait_for_stack_events('ats-buddy-dev')
+        if settled is False:
+            return False
+
+    if settled is None:
+        try:
+            cf = _client('cloudformation')
+            waiter_name = 'stack_update_complete' if stack_exists else 'stack_create_complete'
+            print("\n⏳ Waiting for stack to settle...")
+            cf.get_waiter(waiter_name).wait(
+                StackName='ats-buddy-dev',
+                WaiterConfig={'Delay': 5, 'MaxAttempts': 720}
+            )
+        except Exception as e:
+            # --no-fail-on-empty-changeset can leave the waiter with nothing to
+            # wait for; the describe_stacks that follows will catch real failures
+            print(f"⚠️  Stack waiter did not complete cleanly: {e}")
+
+    # The deploy may have changed outputs; force the next reader to
+    # re-describe instead of serving the pre-deploy snapshot
+    _STACK_CACHE.clear()
+
     return True
 
 def get_deployment_outputs():
     """Get deployment outputs from CloudFormation"""
     try:
-        cf = boto3.client('cloudformation')
-        response = cf.describe_stacks(StackName='ats-buddy-dev')
-        
+        stack = _describe_stack('ats-buddy-dev')
+
         outputs = {}
-        for output in response['Stacks'][0]['Outputs']:
+        for output in stack['Outputs']:
             outputs[output['OutputKey']] = output['OutputValue']
-        
+
         return outputs
         
     except Exception as e:
@@ -134,52 +265,70 @@ def get_deployment_outputs():
 def deploy_web_ui():
     """Deploy web UI files to S3 and CloudFront"""
     print("\n🌐 Deploying Web UI to CloudFront...")
-    
-    script_path = Path(__file__).parent / 'deploy_web_ui.py'
-    
-    if not run_command(f"python {script_path}"):
+
+    # Import and run in-process instead of spawning a fresh interpreter,
+    # which would re-import boto3 and redo credential resolution
+    sys.path.insert(0, str(Path(__file__).parent))
+    try:
+        import deploy_web_ui as deploy_web_ui_mod
+        return deploy_web_ui_mod.main() == 0
+    except Exception as e:
+        print(f"❌ Web UI deployment error: {e}")
         return False
-    
-    return True
 
 def display_deployment_summary(outputs):
     """Display deployment summary with security highlights"""
-    print("\n" + "="*60)
-    print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
-    print("="*60)
-    
-    print("\n🔗 Access URLs:")
+    # Build the summary once and emit it in a single write so it lands
+    # atomically (no interleaving with trailing SAM output) instead of
+    # one syscall per print
+    lines = [
+        "",
+        "=" * 60,
+        "🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!",
+        "=" * 60,
+        "",
+        "🔗 Access URLs:",
+    ]
     if 'WebUIUrl' in outputs:
-        print(f"   🌐 Web UI (CloudFront): {outputs['WebUIUrl']}")
+        lines.append(f"   🌐 Web UI (CloudFront): {outputs['WebUIUrl']}")
     if 'ApiGatewayUrl' in outputs:
-        print(f"   🚪 API Gateway: {outputs['ApiGatewayUrl']}")
-    
-    print("\n🔒 Security Features:")
-    print("   ✅ No AWS account ID exposed in URLs")
-    print("   ✅ HTTPS encryption enforced")
-    print("   ✅ Private S3 buckets (CloudFront access only)")
-    print("   ✅ PII redaction with Amazon Comprehend")
-    print("   ✅ Global CDN for performance and security")
-    
-    print("\n📊 AWS Resources Created:")
+        lines.append(f"   🚪 API Gateway: {outputs['ApiGatewayUrl']}")
+
+    lines += [
+        "",
+        "🔒 Security Features:",
+        "   ✅ No AWS account ID exposed in URLs",
+        "   ✅ HTTPS encryption enforced",
+        "   ✅ Private S3 buckets (CloudFront access only)",
+        "   ✅ PII redaction with Amazon Comprehend",
+        "   ✅ Global CDN for performance and security",
+        "",
+        "📊 AWS Resources Created:",
+    ]
     if 'WebUIBucketName' in outputs:
-        print(f"   📁 Web UI S3 Bucket: {outputs['WebUIBucketName']}")
+        lines.append(f"   📁 Web UI S3 Bucket: {outputs['WebUIBucketName']}")
     if 'CloudFrontDistributionId' in outputs:
-        print(f"   🌐 CloudFront Distribution: {outputs['CloudFrontDistributionId']}")
+        lines.append(f"   🌐 CloudFront Distribution: {outputs['CloudFrontDistributionId']}")
     if 'ResumesBucketName' in outputs:
-        print(f"   📄 Resumes S3 Bucket: {outputs['ResumesBucketName']}")
+        lines.append(f"   📄 Resumes S3 Bucket: {outputs['ResumesBucketName']}")
     if 'ReportsBucketName' in outputs:
-        print(f"   📊 Reports S3 Bucket: {outputs['ReportsBucketName']}")
+        lines.append(f"   📊 Reports S3 Bucket: {outputs['ReportsBucketName']}")
     if 'LambdaFunctionName' in outputs:
-        print(f"   ⚡ Lambda Function: {outputs['LambdaFunctionName']}")
-    
-    print("\n💡 Next Steps:")
-    print("   1. Access the Web UI using the CloudFront URL above")
-    print("   2. Upload a PDF resume and job description to test")
-    print("   3. Run validation: python scripts/final_validation.py")
-    
-    print("\n🔄 To update Web UI files:")
-    print("   python scripts/deploy_web_ui.py")
+        lines.append(f"   ⚡ Lambda Function: {outputs['LambdaFunctionName']}")
+
+    lines += [
+        "",
+        "💡 Next Steps:",
+        "   1. Access the Web UI using the CloudFront URL above",
+        "   2. Upload a PDF resume and job description to test",
+        "   3. Run validation: python scripts/final_validation.py",
+        "",
+        "🔄 To update Web UI files:",
+        "   python scripts/deploy_web_ui.py",
+    ]
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 def main():
     """Main deployment function"""
@@ -201,10 +350,6 @@ def main():
         print("   cd infra && sam deploy --guided")
         sys.exit(1)
     
-    # Wait a moment for resources to be ready
-    print("\n⏳ Waiting for resources to be ready...")
-    time.sleep(10)
-    
     # Get deployment outputs
     outputs = get_deployment_outputs()
     if not outputs:
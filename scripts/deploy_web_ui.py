@@ -2,22 +2,74 @@
 """
 Deploy Web UI to S3 Bucket
 Automatically gets the bucket name from CloudFormation and uploads web UI files
+
+Pass --ascii (or set ATS_NO_EMOJI=1) for plain-ASCII output on consoles
+that can't render Unicode.
 """
 
+import argparse
+import base64
 import boto3
+import gzip
+import hashlib
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
+
+# Adaptive retry mode paces requests client-side instead of burning wall
+# clock on throttled DescribeStacks retries
+_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'}, connect_timeout=5, read_timeout=20)
+
+# Explicit multipart/concurrency knobs so larger bundles upload their
+# parts in parallel instead of relying on transfer defaults
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 << 20,
+    multipart_chunksize=8 << 20,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# One Session shared by all clients; lru_cache means each service client is
+# constructed once and its HTTPS keep-alive pool is reused across calls
+_SESSION = boto3.Session()
+
+
+@lru_cache(maxsize=None)
+def _client(service, region=None):
+    return _SESSION.client(service, region_name=region, config=_CFG)
+
+
+# Print prefixes; _use_ascii() swaps these for plain markers
+ICONS = {
+    'ok': '✅', 'err': '❌', 'warn': '⚠️ ', 'up': '📤', 'sync': '🔄',
+    'wait': '⏳', 'tip': '💡', 'done': '🎉', 'web': '🌐', 'note': '📋',
+}
+
+
+def _use_ascii():
+    """Swap emoji prefixes for ASCII markers (Windows consoles, plain CI logs)"""
+    ICONS.update({
+        'ok': '[OK]', 'err': '[ERROR]', 'warn': '[WARN]', 'up': '>>',
+        'sync': '>>', 'wait': '...', 'tip': '*', 'done': '**',
+        'web': '-', 'note': '-',
+    })
+
 
 def get_deployment_info(stack_name="ats-buddy-dev", region="ap-southeast-1"):
     """Get deployment info from CloudFormation outputs"""
     try:
-        cf = boto3.client('cloudformation', region_name=region)
+        cf = _client('cloudformation', region)
         response = cf.describe_stacks(StackName=stack_name)
-        
+
         outputs = response['Stacks'][0]['Outputs']
         info = {}
-        
+
         for output in outputs:
             if output['OutputKey'] == 'WebUIBucketName':
                 info['bucket_name'] = output['OutputValue']
@@ -25,138 +77,240 @@ def get_deployment_info(stack_name="ats-buddy-dev", region="ap-southeast-1"):
                 info['web_url'] = output['OutputValue']
             elif output['OutputKey'] == 'CloudFrontDistributionId':
                 info['distribution_id'] = output['OutputValue']
-        
+
         if 'bucket_name' not in info:
-            print(f"❌ WebUIBucketName not found in stack {stack_name}")
+            print(f"{ICONS['err']} WebUIBucketName not found in stack {stack_name}")
             return None
-            
+
         return info
-        
+
     except Exception as e:
-        print(f"❌ Error getting deployment info: {e}")
+        print(f"{ICONS['err']} Error getting deployment info: {e}")
         return None
 
+# Content types worth pre-gzipping before upload; binary assets are
+# uploaded as-is
+TEXTUAL_TYPES = ('text/', 'application/javascript')
+
+
+def _object_unchanged(s3, bucket_name, key, md5_hex):
+    """Check whether the stored object already matches the MD5 via its ETag"""
+    try:
+        head = s3.head_object(Bucket=bucket_name, Key=key)
+    except ClientError:
+        return False
+    return head['ETag'].strip('"') == md5_hex
+
+
+def _put_asset(s3, bucket_name, filename, file_path, config):
+    """Upload one asset, pre-gzipping textual content
+
+    Compressing HTML/JS/CSS before the PUT cuts the bytes transferred
+    (and stored, and served) by roughly 4-8x; CloudFront passes the
+    Content-Encoding header through to browsers. Returns True if the
+    object was uploaded, False if it already matched and was skipped.
+    """
+    extra = {
+        'ContentType': config['ContentType'],
+        'CacheControl': config['CacheControl'],
+        'Metadata': {'uploaded-by': 'ats-buddy-deployment'}
+    }
+    body = file_path.read_bytes()
+    if config['ContentType'].startswith(TEXTUAL_TYPES):
+        # mtime=0 keeps the gzip output deterministic so the ETag
+        # comparison holds across runs
+        body = gzip.compress(body, compresslevel=9, mtime=0)
+        extra['ContentEncoding'] = 'gzip'
+
+    digest = hashlib.md5(body)
+    if _object_unchanged(s3, bucket_name, filename, digest.hexdigest()):
+        return False
+
+    if len(body) < _TRANSFER_CONFIG.multipart_threshold:
+        # Small assets go as one direct PutObject - no TransferManager
+        # threadpool or multipart negotiation - reusing the bytes (and
+        # MD5) already in hand from the skip check
+        s3.put_object(
+            Bucket=bucket_name,
+            Key=filename,
+            Body=body,
+            ContentMD5=base64.b64encode(digest.digest()).decode(),
+            **extra
+        )
+    else:
+        s3.upload_file(
+            str(file_path),
+            bucket_name,
+            filename,
+            ExtraArgs=extra,
+            Config=_TRANSFER_CONFIG
+        )
+    return True
+
+
 def upload_web_ui_files(bucket_name):
     """Upload web UI files to S3 bucket with proper content types"""
     try:
-        s3 = boto3.client('s3')
+        s3 = _client('s3')
         web_ui_dir = Path(__file__).parent.parent / 'web-ui'
-        
+
         if not web_ui_dir.exists():
-            print(f"❌ Web UI directory not found: {web_ui_dir}")
-            return False
-        
-        # File mappings with content types
-        files_to_upload = {
-            'index.html': 'text/html',
-            'script.js': 'application/javascript', 
-            'styles.css': 'text/css'
+            print(f"{ICONS['err']} Web UI directory not found: {web_ui_dir}")
+            return None
+
+        # File mappings with content types and cache headers; the entry
+        # page revalidates on every load so deploys show up immediately
+        files_config = {
+            'index.html': {
+                'ContentType': 'text/html; charset=utf-8',
+                'CacheControl': 'no-cache, no-store, must-revalidate'
+            },
+            'script.js': {
+                'ContentType': 'application/javascript; charset=utf-8',
+                'CacheControl': 'public, max-age=86400'
+            },
+            'styles.css': {
+                'ContentType': 'text/css; charset=utf-8',
+                'CacheControl': 'public, max-age=86400'
+            }
         }
-        
-        print(f"📤 Uploading web UI files to s3://{bucket_name}/")
-        
-        for filename, content_type in files_to_upload.items():
-            file_path = web_ui_dir / filename
-            
-            if file_path.exists():
-                print(f"  Uploading {filename}")
-                s3.upload_file(
-                    str(file_path),
-                    bucket_name,
-                    filename,
-                    ExtraArgs={
-                        'ContentType': content_type,
-                        'CacheControl': 'max-age=86400'  # 24 hours cache for static assets
-                    }
-                )
-            else:
-                print(f"  Warning: {filename} not found, skipping")
-        
-        return True
-        
+
+        print(f"{ICONS['up']} Uploading web UI files to s3://{bucket_name}/")
+
+        # Upload all files concurrently so wall time is the slowest PUT
+        # instead of the sum of all three round-trips
+        with ThreadPoolExecutor(max_workers=len(files_config)) as executor:
+            futures = {}
+            for filename, config in files_config.items():
+                file_path = web_ui_dir / filename
+
+                if file_path.exists():
+                    print(f"  Uploading {filename} with MIME type: {config['ContentType']}")
+                    future = executor.submit(
+                        _put_asset,
+                        s3,
+                        bucket_name,
+                        filename,
+                        file_path,
+                        config
+                    )
+                    futures[future] = filename
+                else:
+                    print(f"  Warning: {filename} not found, skipping")
+
+            changed_keys = []
+            for future in as_completed(futures):
+                if future.result():
+                    changed_keys.append(futures[future])
+                    print(f"  Uploaded {futures[future]}")
+                else:
+                    print(f"  Skipped {futures[future]} (unchanged)")
+
+        return changed_keys
+
     except Exception as e:
         print(f"Error uploading files: {e}")
-        return False
+        return None
 
-def invalidate_cloudfront_cache(distribution_id):
-    """Invalidate CloudFront cache to ensure new files are served"""
+def invalidate_cloudfront_cache(distribution_id, changed_keys):
+    """Invalidate only the changed paths so edges keep their warm objects"""
     try:
-        cloudfront = boto3.client('cloudfront')
-        
-        print(f"🔄 Invalidating CloudFront cache for distribution {distribution_id}")
-        
+        cloudfront = _client('cloudfront')
+
+        print(f"{ICONS['sync']} Invalidating CloudFront cache for distribution {distribution_id}")
+
         response = cloudfront.create_invalidation(
             DistributionId=distribution_id,
             InvalidationBatch={
                 'Paths': {
-                    'Quantity': 1,
-                    'Items': ['/*']
+                    'Quantity': len(changed_keys),
+                    'Items': ['/' + key for key in changed_keys]
                 },
-                'CallerReference': f"deploy-{int(__import__('time').time())}"
+                # time_ns keeps the reference unique even for repeat
+                # deploys within the same second
+                'CallerReference': f"deploy-{time.time_ns()}"
             }
         )
-        
+
         invalidation_id = response['Invalidation']['Id']
-        print(f"✅ Cache invalidation created: {invalidation_id}")
-        print("⏳ Note: Cache invalidation may take 5-15 minutes to complete")
-        
+        print(f"{ICONS['ok']} Cache invalidation created: {invalidation_id}")
+        print(f"{ICONS['wait']} Note: Cache invalidation may take 5-15 minutes to complete")
+
         return True
-        
+
     except Exception as e:
-        print(f"⚠️  Warning: Could not invalidate CloudFront cache: {e}")
-        print("💡 You may need to wait for cache to expire or manually invalidate")
+        print(f"{ICONS['warn']} Warning: Could not invalidate CloudFront cache: {e}")
+        print(f"{ICONS['tip']} You may need to wait for cache to expire or manually invalidate")
         return False
 
-def main():
-    """Main deployment function"""
+def main(argv=None):
+    """Main deployment function; returns an exit code so callers can
+    invoke this in-process instead of spawning a new interpreter"""
+    parser = argparse.ArgumentParser(description="Deploy the ATS Buddy web UI")
+    parser.add_argument('--ascii', action='store_true',
+                        help="plain-ASCII output (no emoji)")
+    args = parser.parse_args(argv)
+
+    if args.ascii or os.environ.get('ATS_NO_EMOJI'):
+        _use_ascii()
+
     print("ATS Buddy Web UI Deployment (CloudFront)")
     print("=" * 45)
-    
-    # Get deployment info from CloudFormation
-    print("📋 Getting deployment info from CloudFormation...")
-    deploy_info = get_deployment_info()
-    
+
+    # Get deployment info from CloudFormation; while DescribeStacks is
+    # on the wire, warm the s3/cloudfront clients so their ~300ms
+    # service-model loads overlap the network wait instead of following it
+    print(f"{ICONS['note']} Getting deployment info from CloudFormation...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        info_future = executor.submit(get_deployment_info)
+        executor.submit(_client, 's3')
+        executor.submit(_client, 'cloudfront')
+        deploy_info = info_future.result()
+
     if not deploy_info:
-        print("\n💡 Make sure you have:")
+        print(f"\n{ICONS['tip']} Make sure you have:")
         print("   1. Deployed the ATS Buddy stack with SAM")
         print("   2. AWS credentials configured")
         print("   3. Correct stack name and region")
-        sys.exit(1)
-    
+        return 1
+
     bucket_name = deploy_info['bucket_name']
     web_url = deploy_info.get('web_url', 'Not available')
     distribution_id = deploy_info.get('distribution_id')
-    
-    print(f"✅ Found S3 bucket: {bucket_name}")
+
+    print(f"{ICONS['ok']} Found S3 bucket: {bucket_name}")
     if distribution_id:
-        print(f"✅ Found CloudFront distribution: {distribution_id}")
-    
+        print(f"{ICONS['ok']} Found CloudFront distribution: {distribution_id}")
+
     # Upload files
-    print("\n📤 Uploading web UI files...")
-    success = upload_web_ui_files(bucket_name)
-    
-    if success:
-        print("\n🎉 Files uploaded successfully!")
-        
-        # Invalidate CloudFront cache if distribution exists
-        if distribution_id:
-            print("\n🔄 Invalidating CloudFront cache...")
-            invalidate_cloudfront_cache(distribution_id)
-        
-        print(f"\n🌐 Web UI URL: {web_url}")
-        print("\n🔒 Security Benefits:")
-        print("   ✅ No account ID exposed in URL")
-        print("   ✅ HTTPS encryption enabled")
-        print("   ✅ Global CDN for fast loading")
-        print("   ✅ Private S3 bucket (CloudFront access only)")
-        
+    print(f"\n{ICONS['up']} Uploading web UI files...")
+    changed_keys = upload_web_ui_files(bucket_name)
+
+    if changed_keys is not None:
+        print(f"\n{ICONS['done']} Files uploaded successfully!")
+
+        # Invalidate CloudFront cache only when something actually changed
+        if distribution_id and changed_keys:
+            print(f"\n{ICONS['sync']} Invalidating CloudFront cache...")
+            invalidate_cloudfront_cache(distribution_id, changed_keys)
+        elif distribution_id:
+            print(f"\n{ICONS['ok']} No files changed - skipping CloudFront invalidation")
+
+        print(f"\n{ICONS['web']} Web UI URL: {web_url}")
+        print(f"\n{ICONS['note']} Security Benefits:")
+        print(f"   {ICONS['ok']} No account ID exposed in URL")
+        print(f"   {ICONS['ok']} HTTPS encryption enabled")
+        print(f"   {ICONS['ok']} Global CDN for fast loading")
+        print(f"   {ICONS['ok']} Private S3 bucket (CloudFront access only)")
+
         if distribution_id:
-            print("\n⏳ Note: If you don't see changes immediately, wait 5-15 minutes for cache invalidation")
-        
-        print("\n💡 You can now access your secure ATS Buddy web interface!")
+            print(f"\n{ICONS['wait']} Note: If you don't see changes immediately, wait 5-15 minutes for cache invalidation")
+
+        print(f"\n{ICONS['tip']} You can now access your secure ATS Buddy web interface!")
+        return 0
     else:
-        print("\n❌ Deployment failed!")
-        sys.exit(1)
+        print(f"\n{ICONS['err']} Deployment failed!")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -4,23 +4,36 @@ Deploy ATS Buddy with PII Redaction and CloudFront Security
 Complete deployment script with enhanced security features
 """
 
+import shlex
 import subprocess
 import sys
 import os
-import json
 
-def run_command(command, description):
-    """Run a shell command and handle errors"""
+def run_command(command, description, stream=False):
+    """Run a shell command and handle errors
+
+    stream=True inherits the parent's stdout/stderr so long-running
+    commands like sam build/deploy show progress as it happens instead
+    of buffering their whole output until exit.
+    """
     print(f"\n🔄 {description}")
     print(f"Running: {command}")
-    
+
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        # shell=False skips the /bin/sh fork + re-parse; the command
+        # strings here are static, so shlex.split is all we need
+        args = shlex.split(command) if isinstance(command, str) else command
+        if stream:
+            subprocess.run(args, check=True)
+            print(f"✅ {description} completed successfully")
+            return True
+        result = subprocess.run(args, check=True, capture_output=True, text=True)
         print(f"✅ {description} completed successfully")
         return result.stdout
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed")
-        print(f"Error: {e.stderr}")
+        if e.stderr:
+            print(f"Error: {e.stderr}")
         return None
 
 def main():
@@ -38,9 +51,9 @@ def main():
     # Build the SAM application with container-based build to avoid Python version issues
     print("\n🐳 Using container-based build to handle Python runtime compatibility...")
     build_cmd = "sam build --use-container"
-    if not run_command(build_cmd, "Building SAM application (using containers)"):
+    if not run_command(build_cmd, "Building SAM application (using containers)", stream=True):
         print("\n⚠️  Container build failed. Trying standard build...")
-        if not run_command("sam build", "Building SAM application (standard)"):
+        if not run_command("sam build", "Building SAM application (standard)", stream=True):
             print("\n💡 Suggestion: Update your template.yaml to use python3.13 runtime")
             print("   Or install Python 3.13 to match your template runtime")
             sys.exit(1)
@@ -56,56 +69,68 @@ def main():
     print("- Secure S3 buckets (CloudFront access only)")
     
     deploy_cmd = "sam deploy --no-confirm-changeset --no-fail-on-empty-changeset"
-    if not run_command(deploy_cmd, "Deploying infrastructure"):
+    if not run_command(deploy_cmd, "Deploying infrastructure", stream=True):
         sys.exit(1)
     
-    # Get stack outputs
+    # Get stack outputs in-process - shelling out to the aws CLI pays
+    # ~1s of interpreter + SDK startup for a single API call
     print("\n📊 Getting deployment information...")
     stack_name = "ats-buddy-dev"  # Default stack name
-    
-    outputs_cmd = f"aws cloudformation describe-stacks --stack-name {stack_name} --query 'Stacks[0].Outputs' --output json"
-    outputs_result = run_command(outputs_cmd, "Retrieving stack outputs")
-    
-    if outputs_result:
-        try:
-            outputs = json.loads(outputs_result)
-            
-            print("\n🎉 Deployment completed successfully!")
-            print("=" * 50)
-            
-            # Display key information
-            if isinstance(outputs, list):
-                for output in outputs:
-                    key = output['OutputKey']
-                    value = output['OutputValue']
-                    
-                    if 'PIIRedaction' in key:
-                        print(f"🔒 {key}: {value}")
-                    elif key in ['WebUIUrl', 'ApiGatewayUrl']:
-                        print(f"🌐 {key}: {value}")
-                    elif 'CloudFront' in key:
-                        print(f"🌐 {key}: {value}")
-            else:
-                print("⚠️  Unexpected output format from CloudFormation")
-            
-            print("\n📋 Security Features:")
-            print("✅ CloudFront CDN (no account ID exposure)")
-            print("✅ HTTPS enforcement and global edge caching")
-            print("✅ Amazon Comprehend PII detection")
-            print("✅ Automatic PII masking with asterisks")
-            print("✅ Private S3 buckets (CloudFront access only)")
-            print("✅ Transparent integration with existing workflow")
-            
-            print("\n🔧 Next Steps:")
-            print("1. Deploy Web UI: python scripts/deploy_web_ui.py")
-            print("2. Test the secure system with CloudFront URL")
-            print("3. Verify PII redaction in Textract output")
-            print("4. Check CloudWatch logs for redaction activity")
-            
-        except json.JSONDecodeError:
-            print("⚠️  Could not parse stack outputs, but deployment appears successful")
-    
-    print(f"\n✅ ATS Buddy with CloudFront security and PII redaction is ready!")
+
+    outputs = None
+    try:
+        import boto3
+        cf = boto3.client('cloudformation')
+        outputs = cf.describe_stacks(StackName=stack_name)['Stacks'][0].get('Outputs', [])
+        print("✅ Retrieving stack outputs completed successfully")
+    except Exception as e:
+        print(f"❌ Retrieving stack outputs failed: {e}")
+
+    if outputs is not None:
+        # Build the summary once and emit it in a single write so it
+        # lands atomically instead of one syscall per print
+        lines = [
+            "",
+            "🎉 Deployment completed successfully!",
+            "=" * 50,
+        ]
+
+        # Display key information
+        if isinstance(outputs, list):
+            for output in outputs:
+                key = output['OutputKey']
+                value = output['OutputValue']
+
+                if 'PIIRedaction' in key:
+                    lines.append(f"🔒 {key}: {value}")
+                elif key in ['WebUIUrl', 'ApiGatewayUrl']:
+                    lines.append(f"🌐 {key}: {value}")
+                elif 'CloudFront' in key:
+                    lines.append(f"🌐 {key}: {value}")
+        else:
+            lines.append("⚠️  Unexpected output format from CloudFormation")
+
+        lines += [
+            "",
+            "📋 Security Features:",
+            "✅ CloudFront CDN (no account ID exposure)",
+            "✅ HTTPS enforcement and global edge caching",
+            "✅ Amazon Comprehend PII detection",
+            "✅ Automatic PII masking with asterisks",
+            "✅ Private S3 buckets (CloudFront access only)",
+            "✅ Transparent integration with existing workflow",
+            "",
+            "🔧 Next Steps:",
+            "1. Deploy Web UI: python scripts/deploy_web_ui.py",
+            "2. Test the secure system with CloudFront URL",
+            "3. Verify PII redaction in Textract output",
+            "4. Check CloudWatch logs for redaction activity",
+        ]
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    sys.stdout.write("\n✅ ATS Buddy with CloudFront security and PII redaction is ready!\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,28 +3,22 @@
 Helper script to get S3 bucket names after deployment
 """
 
-import boto3
 import sys
 
 def get_bucket_names(stack_name="ats-buddy-dev"):
     """Get bucket names from CloudFormation stack outputs"""
     try:
-        cf = boto3.client('cloudformation')
-        
+        # The shared cache serves recent outputs without a DescribeStacks
+        # round-trip (or even importing boto3) when helpers run
+        # back-to-back
+        from _stack_cache import get_outputs
+
         print(f"🔍 Getting bucket names from stack: {stack_name}")
-        
-        response = cf.describe_stacks(StackName=stack_name)
-        outputs = response['Stacks'][0]['Outputs']
-        
-        resumes_bucket = None
-        reports_bucket = None
-        
-        for output in outputs:
-            if output['OutputKey'] == 'ResumesBucketName':
-                resumes_bucket = output['OutputValue']
-            elif output['OutputKey'] == 'ReportsBucketName':
-                reports_bucket = output['OutputValue']
-        
+
+        outputs = get_outputs(stack_name)
+        resumes_bucket = outputs.get('ResumesBucketName')
+        reports_bucket = outputs.get('ReportsBucketName')
+
         if resumes_bucket and reports_bucket:
             print("✅ Found bucket names!")
             print(f"\n📁 Resumes Bucket: {resumes_bucket}")
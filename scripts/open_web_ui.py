@@ -5,22 +5,40 @@ Open the secure CloudFront web UI in the default browser
 
 import webbrowser
 import sys
-import boto3
+from pathlib import Path
+
+# CloudFront URLs are stable across deploys, so cache the first lookup
+# and skip both the boto3 import (~300ms+) and the DescribeStacks call
+# on every later run
+_URL_CACHE = Path.home() / '.cache' / 'ats-buddy' / 'weburl'
+
 
 def get_web_ui_url(stack_name="ats-buddy-dev", region="ap-southeast-1"):
     """Get the secure CloudFront Web UI URL from CloudFormation outputs"""
     try:
-        cf = boto3.client('cloudformation', region_name=region)
-        response = cf.describe_stacks(StackName=stack_name)
-        
-        outputs = response['Stacks'][0]['Outputs']
-        for output in outputs:
-            if output['OutputKey'] == 'WebUIUrl':
-                return output['OutputValue']
-        
+        url = _URL_CACHE.read_text().strip()
+        if url:
+            return url
+    except OSError:
+        pass
+
+    try:
+        # Shared outputs cache: a recent run of any helper script means
+        # no DescribeStacks call (and no boto3 import) here either
+        from _stack_cache import get_outputs
+
+        url = get_outputs(stack_name, region).get('WebUIUrl')
+        if url:
+            try:
+                _URL_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _URL_CACHE.write_text(url)
+            except OSError:
+                pass
+            return url
+
         print(f"❌ WebUIUrl not found in stack {stack_name}")
         return None
-        
+
     except Exception as e:
         print(f"❌ Error getting Web UI URL: {e}")
         return None
@@ -4,22 +4,71 @@ Quick test script for ATS Buddy - Windows friendly
 Tests the Lambda handler with sample data
 """
 
+import argparse
+import functools
+import hashlib
 import sys
 import json
 import os
+from pathlib import Path
 
-# Add src directory to path
-sys.path.append('src')
+# Put src/ on sys.path (shared, absolute-path bootstrap)
+import _path
 
-def test_bedrock_only():
+from _common import coerce_body
+
+# The sample prompts below are identical across runs, so cache the model
+# output on disk keyed by content hash - repeat runs skip the multi-second
+# (and billed) Bedrock call entirely
+_CACHE_DIR = Path.home() / '.cache' / 'ats-buddy' / 'quick-test'
+
+
+def _cache_file(model_id, resume_text, job_description):
+    key = hashlib.blake2b(
+        f'{model_id}|{resume_text}|{job_description}'.encode(),
+        digest_size=16
+    ).hexdigest()
+    return _CACHE_DIR / f'{key}.json'
+
+
+@functools.lru_cache(maxsize=1)
+def _bedrock():
+    """Construct the Bedrock client once per process
+
+    Client construction parses botocore's service model (~hundreds of
+    ms); repeat test invocations in the same interpreter reuse it.
+    """
+    from bedrock_client import BedrockClient
+    from botocore.config import Config
+
+    # Long prompts can exceed the default 60s read timeout, and each
+    # timeout retry costs a full prompt round trip; keep-alive pooling
+    # also lets a second analysis in the same process skip the TLS
+    # handshake
+    cfg = Config(
+        read_timeout=300,
+        connect_timeout=10,
+        retries={'mode': 'standard', 'max_attempts': 3},
+        max_pool_connections=20,
+        tcp_keepalive=True,
+    )
+    return BedrockClient(config=cfg)
+
+
+@functools.lru_cache(maxsize=1)
+def _handler():
+    """Import the Lambda handler once and reuse it across invocations"""
+    from handler import lambda_handler
+    return lambda_handler
+
+
+def test_bedrock_only(use_cache=True):
     """Test just the Bedrock AI analysis without S3 reports"""
     print("🤖 Testing Bedrock AI Analysis Only")
     print("=" * 40)
-    
+
     try:
-        from bedrock_client import BedrockClient
-        
-        client = BedrockClient()
+        client = _bedrock()
         print(f"✅ Bedrock client initialized: {client.model_id}")
         
         # Sample data
@@ -56,9 +105,40 @@ def test_bedrock_only():
         • Microservices architecture
         '''
         
-        print("🔍 Running AI analysis...")
-        result = client.analyze_resume_vs_job_description(resume_text, job_description)
-        
+        cache_file = _cache_file(client.model_id, resume_text, job_description)
+        result = None
+        if use_cache:
+            try:
+                result = json.loads(cache_file.read_text())
+                print("⚡ Served from local cache (pass --no-cache to re-run the model)")
+            except (OSError, ValueError):
+                result = None
+
+        if result is None:
+            # Streaming surfaces the first tokens in ~hundreds of ms
+            # instead of waiting for the full completion, so a bad prompt
+            # or access problem shows up immediately
+            print("🔍 Running AI analysis (streaming)...")
+            chunks = []
+            for chunk in client.analyze_stream(resume_text, job_description):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+                chunks.append(chunk)
+            sys.stdout.write("\n")
+
+            parsed = client._parse_analysis_response("".join(chunks))
+            result = (
+                {'success': True, 'analysis': parsed['data']}
+                if parsed['success'] else parsed
+            )
+
+            if result['success'] and use_cache:
+                try:
+                    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(json.dumps(result))
+                except OSError:
+                    pass
+
         if result['success']:
             analysis = result['analysis']
             print("✅ SUCCESS!")
@@ -86,8 +166,8 @@ def test_handler():
     print("=" * 40)
     
     try:
-        from handler import lambda_handler
-        
+        lambda_handler = _handler()
+
         # Sample event
         event = {
             'resume_text': '''
@@ -138,7 +218,7 @@ def test_handler():
         
         if result['statusCode'] == 200:
             # Parse body (handle both string and dict)
-            body = result['body'] if isinstance(result['body'], dict) else json.loads(result['body'])
+            body = coerce_body(result['body'])
             
             if body['success']:
                 print("   ✅ SUCCESS!")
@@ -158,7 +238,7 @@ def test_handler():
                 
         else:
             # Handle error response
-            body = result['body'] if isinstance(result['body'], dict) else json.loads(result['body'])
+            body = coerce_body(result['body'])
             print("   ❌ FAILED")
             error_msg = body.get('error', 'Unknown error')
             print(f"   Error: {error_msg}")
@@ -184,23 +264,48 @@ def test_handler():
         print(f"❌ Unexpected error: {e}")
         print("💡 Check the error details above")
 
-if __name__ == "__main__":
-    print("🧪 ATS Buddy Quick Test")
-    print("=" * 50)
+def _parse_args(argv=None):
+    """Resolve the test mode from argv, prompting only on a real terminal
+
+    CI and scripted runs pass --mode (or pipe stdin) and never block on
+    input(); interactive use keeps the familiar menu. Returns the mode
+    and whether the local result cache may be used.
+    """
+    parser = argparse.ArgumentParser(description="Quick test for ATS Buddy")
+    parser.add_argument('--mode', choices=['bedrock', 'handler'], default=None,
+                        help="bedrock: AI analysis only; handler: full Lambda handler")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always invoke the model, ignoring the local result cache")
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        return args.mode, not args.no_cache
+
+    if not sys.stdin.isatty():
+        return 'bedrock', not args.no_cache
+
     print("Choose test mode:")
     print("1. 🤖 Bedrock AI Analysis Only (Recommended)")
     print("2. 🚀 Full Lambda Handler (Requires S3 setup)")
-    
+
     choice = input("\nEnter choice (1 or 2): ").strip()
-    
-    if choice == "1":
-        test_bedrock_only()
-    elif choice == "2":
-        test_handler()
-    else:
+    if choice == "2":
+        return 'handler', not args.no_cache
+    if choice != "1":
         print("Invalid choice. Running Bedrock-only test...")
-        test_bedrock_only()
-    
+    return 'bedrock', not args.no_cache
+
+
+if __name__ == "__main__":
+    print("🧪 ATS Buddy Quick Test")
+    print("=" * 50)
+
+    mode, use_cache = _parse_args()
+    if mode == 'bedrock':
+        test_bedrock_only(use_cache)
+    else:
+        test_handler()
+
     print("\n" + "=" * 50)
     print("🎯 Test completed!")
     print("\n💡 Next steps:")
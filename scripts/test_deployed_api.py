@@ -3,132 +3,204 @@
 Test the deployed API Gateway endpoint directly
 """
 
+import functools
+import io
+import itertools
 import requests
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def test_deployed_api():
+# One pooled session shared by the CORS preflight and the POST so both
+# ride the same keep-alive connection - one TLS handshake instead of two
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2,
+                      status_forcelist=(502, 503, 504))
+))
+
+# Fallback PDF content when the sample file is missing
+_MINIMAL_PDF = b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj 2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj 3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj xref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \ntrailer<</Size 4/Root 1 0 R>>\nstartxref\n174\n%%EOF'
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_pdf_path():
+    """Resolve the sample resume path, or None when absent
+
+    The exists() stat happens once per process, not once per call -
+    relevant when the test is driven in a loop or under pytest-repeat.
+    """
+    pdf_path = Path(__file__).resolve().parent.parent / 'docs' / 'sample_resume.pdf'
+    return pdf_path if pdf_path.exists() else None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sample_pdf():
+    """Read the sample resume once and memoize the bytes
+
+    The file never changes while the script runs, so repeat invocations
+    (loops, pytest) skip the open/read entirely. Returns the bytes, the
+    upload filename, and the path when the real sample was found.
+    """
+    pdf_path = _sample_pdf_path()
+    if pdf_path is not None:
+        return pdf_path.read_bytes(), 'sample_resume.pdf', pdf_path
+    return _MINIMAL_PDF, 'test_resume.pdf', None
+
+
+def _body_preview(response, chunks=4):
+    """Read only the first ~4KB of a streamed response body
+
+    Error payloads can carry stack traces or whole redacted documents;
+    the debug prints below only need a preview, so don't pull the rest
+    off the socket.
+    """
+    preview = b''.join(itertools.islice(response.iter_content(1024), chunks))
+    return preview.decode('utf-8', 'replace')
+
+
+def test_deployed_api(out=sys.stdout):
     """Test the deployed API Gateway endpoint"""
-    
+
     api_url = "https://4rvo13bwv1.execute-api.ap-southeast-1.amazonaws.com/dev/analyze"
-    
+
     # Test with simple text data (multipart form)
     files = {
         'jobDescription': (None, 'Software Engineer position requiring Python, AWS, Docker, and 3+ years experience')
     }
-    
-    # Use the actual sample PDF file
-    pdf_path = Path(__file__).parent.parent / 'docs' / 'sample_resume.pdf'
-    
-    if pdf_path.exists():
-        with open(pdf_path, 'rb') as pdf_file:
-            files['resume'] = ('sample_resume.pdf', pdf_file.read(), 'application/pdf')
-        print(f"📄 Using sample PDF: {pdf_path}")
+
+    pdf_bytes, pdf_name, pdf_path = _load_sample_pdf()
+    if pdf_path:
+        print(f"📄 Using sample PDF: {pdf_path}", file=out)
     else:
-        print(f"❌ Sample PDF not found at: {pdf_path}")
-        print("   Creating a minimal PDF for testing...")
-        # Fallback: create minimal PDF content for testing
-        minimal_pdf = b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj 2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj 3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj xref\n0 4\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \ntrailer<</Size 4/Root 1 0 R>>\nstartxref\n174\n%%EOF'
-        files['resume'] = ('test_resume.pdf', minimal_pdf, 'application/pdf')
-    
-    print("🧪 Testing deployed API Gateway endpoint...")
-    print(f"📡 URL: {api_url}")
-    
+        print("❌ Sample PDF not found - using a minimal PDF for testing...", file=out)
+    files['resume'] = (pdf_name, pdf_bytes, 'application/pdf')
+
+    print("🧪 Testing deployed API Gateway endpoint...", file=out)
+    print(f"📡 URL: {api_url}", file=out)
+
     try:
-        response = requests.post(api_url, files=files, timeout=60)
-        
-        print(f"\n📊 Response:")
-        print(f"   Status Code: {response.status_code}")
-        print(f"   Headers: {dict(response.headers)}")
-        
+        # stream=True defers the body read so error paths can take a
+        # bounded preview instead of materializing the whole payload.
+        # Split (connect, read) timeouts: a dead endpoint fails in ~3s
+        # instead of burning the whole 60s read budget.
+        response = SESSION.post(api_url, files=files, timeout=(3.05, 60), stream=True)
+
+        print(f"\n📊 Response:", file=out)
+        print(f"   Status Code: {response.status_code}", file=out)
+        print(f"   Headers: {response.headers}", file=out)
+
         if response.status_code == 200:
             try:
                 data = response.json()
-                print(f"   ✅ SUCCESS!")
-                print(f"   Session ID: {data.get('sessionId', 'N/A')}")
-                print(f"   Compatibility Score: {data.get('compatibilityScore', 'N/A')}%")
-                print(f"   Missing Keywords: {len(data.get('missingKeywords', []))}")
-                print(f"   Suggestions: {len(data.get('suggestions', []))}")
-                
+                print(f"   ✅ SUCCESS!", file=out)
+                print(f"   Session ID: {data.get('sessionId', 'N/A')}", file=out)
+                print(f"   Compatibility Score: {data.get('compatibilityScore', 'N/A')}%", file=out)
+                print(f"   Missing Keywords: {len(data.get('missingKeywords', []))}", file=out)
+                print(f"   Suggestions: {len(data.get('suggestions', []))}", file=out)
+
                 if data.get('reports'):
-                    print(f"   Reports Available: {list(data['reports'].keys())}")
-                    
+                    print(f"   Reports Available: {list(data['reports'].keys())}", file=out)
+
             except json.JSONDecodeError:
-                print(f"   ✅ SUCCESS (Non-JSON response)")
-                print(f"   Response: {response.text[:200]}...")
-                
+                print(f"   ✅ SUCCESS (Non-JSON response)", file=out)
+                print(f"   Response: {response.text[:200]}...", file=out)
+
         elif response.status_code == 422:
             # Handle processing errors (might be expected for test PDF)
             try:
-                error_data = response.json()
+                error_data = json.loads(_body_preview(response))
                 error_msg = error_data.get('error', 'Unknown error')
                 if 'Unsupported file format' in error_msg or 'Only PDF files are supported' in error_msg:
-                    print(f"   ⚠️  PDF validation error: {error_msg}")
-                    print(f"   This might indicate an issue with the test PDF")
+                    print(f"   ⚠️  PDF validation error: {error_msg}", file=out)
+                    print(f"   This might indicate an issue with the test PDF", file=out)
                     return False
                 elif 'Text extraction failed' in error_msg:
-                    print(f"   ⚠️  Text extraction failed: {error_msg}")
-                    print(f"   This might be expected for minimal test PDFs")
-                    print(f"   ✅ API is responding correctly to processing errors")
+                    print(f"   ⚠️  Text extraction failed: {error_msg}", file=out)
+                    print(f"   This might be expected for minimal test PDFs", file=out)
+                    print(f"   ✅ API is responding correctly to processing errors", file=out)
                     return True
                 else:
-                    print(f"   ❌ UNEXPECTED ERROR: {error_msg}")
+                    print(f"   ❌ UNEXPECTED ERROR: {error_msg}", file=out)
                     return False
             except:
-                print(f"   ❌ FAILED to parse error response")
+                print(f"   ❌ FAILED to parse error response", file=out)
                 return False
-                
+
         else:
-            print(f"   ❌ FAILED")
+            print(f"   ❌ FAILED", file=out)
+            body = _body_preview(response)
             try:
-                error_data = response.json()
-                print(f"   Error: {error_data.get('error', 'Unknown error')}")
+                error_data = json.loads(body)
+                print(f"   Error: {error_data.get('error', 'Unknown error')}", file=out)
             except:
-                print(f"   Raw Response: {response.text}")
+                print(f"   Raw Response: {body}", file=out)
             return False
-        
+
         return True
-                
+
     except requests.exceptions.Timeout:
-        print(f"   ⏰ TIMEOUT (>60 seconds)")
-        print(f"   This might be normal for first request (cold start)")
-        
+        print(f"   ⏰ TIMEOUT (>60 seconds)", file=out)
+        print(f"   This might be normal for first request (cold start)", file=out)
+
     except Exception as e:
-        print(f"   ❌ REQUEST FAILED: {e}")
+        print(f"   ❌ REQUEST FAILED: {e}", file=out)
 
-def test_cors():
+def test_cors(out=sys.stdout):
     """Test CORS preflight request"""
-    
+
     api_url = "https://4rvo13bwv1.execute-api.ap-southeast-1.amazonaws.com/dev/analyze"
-    
-    print("\n🔒 Testing CORS preflight...")
-    
+
+    print("\n🔒 Testing CORS preflight...", file=out)
+
     try:
-        response = requests.options(api_url, headers={
+        response = SESSION.options(api_url, headers={
             'Origin': 'http://localhost:3000',
             'Access-Control-Request-Method': 'POST',
             'Access-Control-Request-Headers': 'Content-Type'
-        })
-        
-        print(f"   Status Code: {response.status_code}")
-        print(f"   CORS Headers:")
-        for header, value in response.headers.items():
-            if 'access-control' in header.lower():
-                print(f"     {header}: {value}")
-                
+        }, timeout=(3.05, 10))
+
+        print(f"   Status Code: {response.status_code}", file=out)
+        print(f"   CORS Headers:", file=out)
+        # One write for the whole header block instead of a print per line
+        out.write('\n'.join(
+            f"     {header}: {value}"
+            for header, value in response.headers.items()
+            if 'access-control' in header.lower()
+        ) + '\n')
+
     except Exception as e:
-        print(f"   ❌ CORS TEST FAILED: {e}")
+        print(f"   ❌ CORS TEST FAILED: {e}", file=out)
+
+def _buffered(fn):
+    """Run one test against a private buffer so concurrent tests never
+    interleave their output"""
+    out = io.StringIO()
+    return fn(out=out), out
 
 if __name__ == "__main__":
     print("🚀 Testing Deployed ATS Buddy API")
     print("=" * 50)
-    
-    test_cors()
-    api_success = test_deployed_api()
-    
+
+    # The preflight and the POST are independent requests to the same
+    # endpoint - run them together so total wall time is the (slower)
+    # POST alone. Both share SESSION's connection pool.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fcors = executor.submit(_buffered, test_cors)
+        fapi = executor.submit(_buffered, test_deployed_api)
+        _, cors_out = fcors.result()
+        api_success, api_out = fapi.result()
+    sys.stdout.write(cors_out.getvalue())
+    sys.stdout.write(api_out.getvalue())
+
     print("\n" + "=" * 50)
     if api_success:
         print("🎯 Test completed successfully! API is working correctly.")
     else:
         print("⚠️  Test completed with issues. Check the output above.")
-    print("🌐 Web UI: http://ats-buddy-web-ui-dev-123456789.s3-website-ap-southeast-1.amazonaws.com")
\ No newline at end of file
+    print("🌐 Web UI: http://ats-buddy-web-ui-dev-123456789.s3-website-ap-southeast-1.amazonaws.com")
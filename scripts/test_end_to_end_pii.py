@@ -7,13 +7,17 @@ import sys
 import os
 import json
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Put src/ on sys.path (shared, absolute-path bootstrap)
+import _path
 
-from handler import lambda_handler
+from _common import coerce_body
 
 def test_pii_redaction_end_to_end():
     """Test complete pipeline with PII redaction"""
+    # Deferred: handler pulls in boto3/botocore (~hundreds of ms), so
+    # the cost is only paid when the pipeline actually runs
+    from handler import lambda_handler
+
     print("🧪 End-to-End PII Redaction Test")
     print("=" * 50)
     
@@ -72,9 +76,7 @@ Requirements:
         print(f"Status Code: {result['statusCode']}")
         
         if result['statusCode'] == 200:
-            body = result['body']
-            if isinstance(body, str):
-                body = json.loads(body)
+            body = coerce_body(result['body'])
             
             print("✅ Analysis completed successfully!")
             
@@ -102,12 +104,10 @@ Requirements:
             
         else:
             print(f"❌ Analysis failed with status {result['statusCode']}")
-            body = result.get('body', {})
-            if isinstance(body, str):
-                try:
-                    body = json.loads(body)
-                except:
-                    pass
+            try:
+                body = coerce_body(result.get('body', {}))
+            except ValueError:
+                body = result.get('body', {})
             error = body.get('error', 'Unknown error') if isinstance(body, dict) else str(body)
             print(f"Error: {error}")
             return False
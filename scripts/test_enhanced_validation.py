@@ -7,8 +7,8 @@ import sys
 import os
 import json
 
-# Add src directory to path
-sys.path.insert(0, 'src')
+# Put src/ on sys.path (shared, absolute-path bootstrap)
+import _path
 
 from pdf_validator import PDFValidator
 
@@ -27,20 +27,20 @@ def main():
     
     validator = PDFValidator()
     
-    # Test detailed file info
+    # Test detailed file info - one write per block instead of one per line
     print("Getting file information...")
     file_info = validator.get_detailed_file_info(bucket_name, s3_key)
-    for key, value in file_info.items():
-        print(f"  {key}: {value}")
-    
+    sys.stdout.write('\n'.join(f"  {key}: {value}" for key, value in file_info.items()) + '\n')
+
     print("\nValidating PDF structure...")
     validation_result = validator.validate_pdf_structure(bucket_name, s3_key)
-    
+
     if validation_result['valid']:
         print("✓ PDF structure validation passed")
-        for key, value in validation_result.items():
-            if key != 'valid':
-                print(f"  {key}: {value}")
+        sys.stdout.write('\n'.join(
+            f"  {key}: {value}"
+            for key, value in validation_result.items() if key != 'valid'
+        ) + '\n')
     else:
         print("✗ PDF structure validation failed")
         print(f"  Error: {validation_result['error']}")
@@ -3,17 +3,28 @@
 Test PII Redaction After Text Extraction
 """
 
+import io
+import itertools
+import re
 import sys
 import os
 import json
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# The PII literals the test plants in the sample text. A single compiled
+# alternation scans the redacted output in one pass instead of one full
+# substring scan per literal.
+_ORIGINAL_PII = ["john.smith@example.com", "(555) 123-4567", "123-45-6789"]
+_PII_PATTERNS = re.compile('|'.join(map(re.escape, _ORIGINAL_PII)))
 
-from handler import apply_pii_redaction_to_text
+# Put src/ on sys.path (shared, absolute-path bootstrap)
+import _path
 
 def test_pii_redaction_function():
     """Test the PII redaction function directly"""
+    # Deferred: handler pulls in boto3/botocore (~hundreds of ms), so
+    # the cost is only paid when the redaction test actually runs
+    from handler import apply_pii_redaction_to_text
+
     print("🧪 Testing PII Redaction Function")
     print("=" * 50)
     
@@ -44,7 +55,13 @@ SKILLS
     print("📄 Original Text:")
     print("Contains PII: John Smith, john.smith@example.com, (555) 123-4567, 123-45-6789")
     print(f"Text length: {len(test_text)} characters")
-    
+
+    # Text too short to hold PII, or with no digits at all, can't contain
+    # the phone/SSN/credit-card classes - skip the Comprehend call
+    if len(test_text) < 16 or not any(c.isdigit() for c in test_text):
+        print("\nℹ️  Text cannot contain detectable PII - skipping redaction call")
+        return True
+
     try:
         # Apply PII redaction
         print("\n🔄 Applying PII redaction...")
@@ -56,22 +73,22 @@ SKILLS
             
             if result["redacted"]:
                 print("\n📝 Redacted Text Sample:")
-                redacted_lines = result["text"].split('\n')[:10]  # First 10 lines
-                for line in redacted_lines:
-                    if line.strip():
-                        print(f"  {line}")
-                
+                # Stream the first ten non-blank lines instead of
+                # split()-materializing every line of what can be a
+                # whole redacted document
+                preview = itertools.islice(
+                    (line for line in io.StringIO(result["text"]) if line.strip()),
+                    10
+                )
+                sample = ''.join(f"  {line}" for line in preview)
+                sys.stdout.write(sample if sample.endswith('\n') else sample + '\n')
+
                 print(f"\nRedacted text length: {len(result['text'])} characters")
                 
-                # Check if PII was actually redacted
-                original_pii = ["john.smith@example.com", "(555) 123-4567", "123-45-6789"]
-                redacted_text = result["text"]
-                
-                pii_found = []
-                for pii in original_pii:
-                    if pii in redacted_text:
-                        pii_found.append(pii)
-                
+                # Check if PII was actually redacted - one regex pass
+                # over the output instead of a scan per literal
+                pii_found = sorted(set(_PII_PATTERNS.findall(result["text"])))
+
                 if pii_found:
                     print(f"⚠️  Some PII may still be present: {pii_found}")
                 else:
@@ -4,13 +4,104 @@ FINAL COMPLETE PROOF - ATS Buddy is fully functional!
 This test proves every component works with real AWS Bedrock
 """
 
+import functools
+import hashlib
+import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Add src directory to path
-sys.path.append('src')
+# Put src/ on sys.path (shared, absolute-path bootstrap)
+import _path
+
+@functools.lru_cache(maxsize=None)
+def _read_sample(path):
+    """Read one sample file, memoized for the process lifetime
+
+    The scenarios reuse the same resume and job description files, and
+    the report test re-reads two of them again - the cache collapses
+    those to one disk read per distinct file.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().strip()
+
+# Successful analyses keyed by (model, resume digest, JD digest). The
+# report test reuses the first scenario's inputs verbatim, so it can
+# serve that analysis from here instead of paying a second Bedrock call.
+_ANALYSIS_CACHE = {}
+
+def _analysis_key(model_id, resume_text, job_description):
+    """Cache key for one (model, resume, job description) analysis"""
+    return (
+        model_id,
+        hashlib.sha256(resume_text.encode('utf-8')).hexdigest(),
+        hashlib.sha256(job_description.encode('utf-8')).hexdigest(),
+    )
+
+def _run_scenario(client, scenario, out):
+    """Run one analysis scenario, printing into a private buffer
+
+    Each worker writes to its own buffer so concurrent scenarios never
+    interleave their output; main renders the buffers in scenario order.
+    """
+    try:
+        # Load data (cached - scenarios share files)
+        resume_text = _read_sample(scenario['resume_file'])
+        job_description = _read_sample(scenario['job_file'])
+
+        # Real AI analysis
+        result = client.analyze_resume_vs_job_description(resume_text, job_description)
+
+        if result['success']:
+            _ANALYSIS_CACHE[
+                _analysis_key(client.model_id, resume_text, job_description)
+            ] = result
+            analysis = result['analysis']
+            score = analysis['compatibility_score']
+            missing = len(analysis['missing_keywords'])
+            suggestions = len(analysis['suggestions'])
+            strengths = len(analysis['strengths'])
+
+            # Check if score is in expected range
+            min_score, max_score = scenario['expected_range']
+            score_ok = min_score <= score <= max_score
+
+            print(f"   📊 Score: {score}% {'✅' if score_ok else '⚠️'}", file=out)
+            print(f"   🔍 Missing Keywords: {missing}", file=out)
+            print(f"   💡 Suggestions: {suggestions}", file=out)
+            print(f"   ✅ Strengths: {strengths}", file=out)
+
+            # Show sample missing keywords
+            if analysis['missing_keywords']:
+                print(f"   🎯 Key Missing: {', '.join(analysis['missing_keywords'][:3])}", file=out)
+
+            return {
+                'scenario': scenario['name'],
+                'success': True,
+                'score': score,
+                'missing_keywords': missing,
+                'suggestions': suggestions,
+                'strengths': strengths,
+                'score_in_range': score_ok
+            }
+
+        else:
+            print(f"   ❌ Failed: {result.get('error')}", file=out)
+            return {
+                'scenario': scenario['name'],
+                'success': False,
+                'error': result.get('error')
+            }
+
+    except Exception as e:
+        print(f"   💥 Exception: {e}", file=out)
+        return {
+            'scenario': scenario['name'],
+            'success': False,
+            'error': str(e)
+        }
 
 def test_real_bedrock_analysis():
     """Test real Bedrock analysis with multiple scenarios"""
@@ -45,66 +136,31 @@ def test_real_bedrock_analysis():
         client = BedrockClient()
         
         print(f"✅ Using real Bedrock model: {client.model_id}")
-        
-        for i, scenario in enumerate(scenarios, 1):
-            print(f"\n{i}. Testing: {scenario['name']}")
-            
-            try:
-                # Load data
-                with open(scenario['resume_file'], 'r', encoding='utf-8') as f:
-                    resume_text = f.read().strip()
-                with open(scenario['job_file'], 'r', encoding='utf-8') as f:
-                    job_description = f.read().strip()
-                
-                # Real AI analysis
-                result = client.analyze_resume_vs_job_description(resume_text, job_description)
-                
-                if result['success']:
-                    analysis = result['analysis']
-                    score = analysis['compatibility_score']
-                    missing = len(analysis['missing_keywords'])
-                    suggestions = len(analysis['suggestions'])
-                    strengths = len(analysis['strengths'])
-                    
-                    # Check if score is in expected range
-                    min_score, max_score = scenario['expected_range']
-                    score_ok = min_score <= score <= max_score
-                    
-                    print(f"   📊 Score: {score}% {'✅' if score_ok else '⚠️'}")
-                    print(f"   🔍 Missing Keywords: {missing}")
-                    print(f"   💡 Suggestions: {suggestions}")
-                    print(f"   ✅ Strengths: {strengths}")
-                    
-                    # Show sample missing keywords
-                    if analysis['missing_keywords']:
-                        print(f"   🎯 Key Missing: {', '.join(analysis['missing_keywords'][:3])}")
-                    
-                    results.append({
-                        'scenario': scenario['name'],
-                        'success': True,
-                        'score': score,
-                        'missing_keywords': missing,
-                        'suggestions': suggestions,
-                        'strengths': strengths,
-                        'score_in_range': score_ok
-                    })
-                    
-                else:
-                    print(f"   ❌ Failed: {result.get('error')}")
-                    results.append({
-                        'scenario': scenario['name'],
-                        'success': False,
-                        'error': result.get('error')
-                    })
-                    
-            except Exception as e:
-                print(f"   💥 Exception: {e}")
-                results.append({
-                    'scenario': scenario['name'],
-                    'success': False,
-                    'error': str(e)
-                })
-        
+
+        # Pre-warm the file cache serially: lru_cache doesn't dedupe
+        # in-flight calls, so warming here keeps the workers from
+        # racing to read the same shared file
+        for scenario in scenarios:
+            _read_sample(scenario['resume_file'])
+            _read_sample(scenario['job_file'])
+
+        # The scenarios are independent Bedrock calls and botocore
+        # clients are thread-safe, so run them concurrently on one
+        # shared client - wall time becomes the slowest analysis
+        # instead of the sum of all three
+        with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+            buffers = [io.StringIO() for _ in scenarios]
+            futures = [
+                executor.submit(_run_scenario, client, scenario, out)
+                for scenario, out in zip(scenarios, buffers)
+            ]
+            for i, (scenario, future, out) in enumerate(
+                zip(scenarios, futures, buffers), 1
+            ):
+                results.append(future.result())
+                print(f"\n{i}. Testing: {scenario['name']}")
+                sys.stdout.write(out.getvalue())
+
         return results
         
     except Exception as e:
@@ -120,14 +176,19 @@ def test_report_generation_with_real_ai():
         # Get real AI analysis
         from bedrock_client import BedrockClient
         
-        with open('samples/resumes/software_engineer.txt', 'r', encoding='utf-8') as f:
-            resume_text = f.read().strip()
-        with open('samples/job_descriptions/backend_engineer.txt', 'r', encoding='utf-8') as f:
-            job_description = f.read().strip()
+        resume_text = _read_sample('samples/resumes/software_engineer.txt')
+        job_description = _read_sample('samples/job_descriptions/backend_engineer.txt')
         
         client = BedrockClient()
-        ai_result = client.analyze_resume_vs_job_description(resume_text, job_description)
-        
+
+        # The analysis test already ran this exact resume/JD pair -
+        # reuse its result rather than paying a second Bedrock call
+        ai_result = _ANALYSIS_CACHE.get(
+            _analysis_key(client.model_id, resume_text, job_description)
+        )
+        if ai_result is None:
+            ai_result = client.analyze_resume_vs_job_description(resume_text, job_description)
+
         if not ai_result['success']:
             print(f"❌ Could not get AI analysis for report test")
             return False
@@ -203,15 +264,27 @@ def create_final_proof_summary(bedrock_results, report_success):
     
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    # Calculate success metrics
-    successful_analyses = [r for r in bedrock_results if r['success']]
+    # Calculate success metrics and score aggregates in one pass
+    # instead of separate sum/min/max walks over the successes
+    successful_analyses = []
+    total = 0
+    smin = smax = None
+    for r in bedrock_results:
+        if r['success']:
+            successful_analyses.append(r)
+            score = r['score']
+            total += score
+            if smin is None or score < smin:
+                smin = score
+            if smax is None or score > smax:
+                smax = score
+
     total_scenarios = len(bedrock_results)
     success_rate = len(successful_analyses) / total_scenarios * 100 if total_scenarios > 0 else 0
-    
-    # Calculate average score
+
     if successful_analyses:
-        avg_score = sum(r['score'] for r in successful_analyses) / len(successful_analyses)
-        score_range = f"{min(r['score'] for r in successful_analyses)}-{max(r['score'] for r in successful_analyses)}%"
+        avg_score = total / len(successful_analyses)
+        score_range = f"{smin}-{smax}%"
     else:
         avg_score = 0
         score_range = "N/A"
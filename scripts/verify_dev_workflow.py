@@ -7,7 +7,6 @@ Fixed version that handles Windows Unicode encoding issues properly
 import subprocess
 import sys
 import os
-import importlib.util
 from pathlib import Path
 
 # Fix Unicode encoding for Windows
@@ -43,8 +42,9 @@ def run_command(command, description):
             print(f"✅ SUCCESS")
             if result.stdout.strip():
                 output = result.stdout.strip()
-                # Clean output of problematic Unicode characters
-                clean_output = ''.join(char if ord(char) < 128 else '?' for char in output)
+                # Clean output of problematic Unicode characters - the
+                # ASCII codec round trip does this in C, no per-char loop
+                clean_output = output.encode('ascii', 'replace').decode('ascii')
                 print(f"Output: {clean_output[:200]}...")
             return True
         else:
@@ -52,7 +52,7 @@ def run_command(command, description):
             if result.stderr.strip():
                 error = result.stderr.strip()
                 # Clean error output
-                clean_error = ''.join(char if ord(char) < 128 else '?' for char in error)
+                clean_error = error.encode('ascii', 'replace').decode('ascii')
                 print(f"Error: {clean_error[:200]}...")
             return False
             
@@ -63,6 +63,77 @@ def run_command(command, description):
         print(f"❌ ERROR: {e}")
         return False
 
+def run_pytest(args, description):
+    """Run pytest in-process instead of spawning an interpreter"""
+    print(f"\n🔍 {description}")
+    print(f"Command: pytest {' '.join(args)}")
+
+    try:
+        import pytest
+        exit_code = pytest.main(args)
+        if exit_code == 0:
+            print(f"✅ SUCCESS")
+            return True
+        print(f"❌ FAILED (exit code: {exit_code})")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False
+
+def run_black_check(description):
+    """Run black's format check via its Python API (no subprocess)"""
+    print(f"\n🔍 {description}")
+    print("Command: black --check src/ tests/ examples/ --diff")
+
+    try:
+        import black
+    except ImportError:
+        print("❌ FAILED: black is not installed")
+        return False
+
+    try:
+        # black signals its result through SystemExit even with
+        # standalone_mode off, so capture the exit code from there
+        black.main(
+            ["--check", "src/", "tests/", "examples/", "--diff"],
+            standalone_mode=False,
+        )
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code or 0
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False
+
+    if exit_code == 0:
+        print(f"✅ SUCCESS")
+        return True
+    print(f"❌ FAILED (exit code: {exit_code})")
+    return False
+
+def run_flake8_check(description):
+    """Run flake8's critical-error check via its legacy API"""
+    print(f"\n🔍 {description}")
+    print("Command: flake8 src/ tests/ examples/ --select=E9,F63,F7,F82")
+
+    try:
+        from flake8.api import legacy as flake8_api
+    except ImportError:
+        print("❌ FAILED: flake8 is not installed")
+        return False
+
+    try:
+        style_guide = flake8_api.get_style_guide(select=["E9", "F63", "F7", "F82"])
+        report = style_guide.check_files(["src", "tests", "examples"])
+        if report.total_errors == 0:
+            print(f"✅ SUCCESS")
+            return True
+        print(f"❌ FAILED ({report.total_errors} critical issues)")
+        return False
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+        return False
+
 def test_direct_import():
     """Test handler import directly without subprocess"""
     print("\n🔍 Direct handler import test")
@@ -94,40 +165,74 @@ def test_direct_import():
         # Restore original path
         sys.path = original_path
 
+# Compiled demo code objects by path, so re-runs in the same process
+# (CI retries, repeated verification) skip the read and reparse
+_DEMO_CODE = {}
+
+def _demo_code(demo_path):
+    """Compile the demo script once and cache the code object"""
+    code = _DEMO_CODE.get(demo_path)
+    if code is None:
+        code = compile(demo_path.read_bytes(), str(demo_path), "exec")
+        _DEMO_CODE[demo_path] = code
+    return code
+
+class _GrepSink:
+    """Write sink that only remembers whether a needle was seen
+
+    The demo test only greps its (potentially large) stdout for one
+    marker line, so checking each chunk as it is written keeps memory
+    O(1) instead of accumulating the whole transcript in a StringIO.
+    """
+
+    def __init__(self, needle):
+        self.needle = needle
+        self.hit = False
+
+    def write(self, s):
+        if not self.hit and self.needle in s:
+            self.hit = True
+        return len(s)
+
+    def flush(self):
+        pass
+
 def test_demo_script():
     """Test demo script directly without subprocess"""
     print("\n🔍 Direct demo script test")
     print("Testing: examples/demo_complete_workflow.py")
-    
+
     demo_path = Path("examples/demo_complete_workflow.py")
     if not demo_path.exists():
         print("❌ FAILED: Demo script not found")
         return False
-    
+
     try:
-        # Import the demo module
-        spec = importlib.util.spec_from_file_location("demo", demo_path)
-        demo_module = importlib.util.module_from_spec(spec)
-        
-        # Capture stdout to avoid encoding issues
+        # Capture output to avoid encoding issues; stdout only feeds
+        # the marker grep, stderr is kept for the failure message
         import io
         from contextlib import redirect_stdout, redirect_stderr
-        
-        stdout_capture = io.StringIO()
+
+        stdout_sink = _GrepSink("Complete Pipeline Demo Successful")
         stderr_capture = io.StringIO()
-        
-        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            spec.loader.exec_module(demo_module)
-        
-        stdout_content = stdout_capture.getvalue()
+
+        # Run the script as __main__ via a plain compile + exec - the
+        # import-system machinery (spec, loader, module object) buys
+        # nothing for a one-shot script
+        with redirect_stdout(stdout_sink), redirect_stderr(stderr_capture):
+            exec(
+                _demo_code(demo_path),
+                {"__name__": "__main__", "__file__": str(demo_path)},
+            )
+
         stderr_content = stderr_capture.getvalue()
-        
+
         if stderr_content and "Error" in stderr_content:
             print(f"❌ FAILED: {stderr_content[:100]}...")
             return False
         else:
             print("✅ SUCCESS - Demo script executed without errors")
-            if "Complete Pipeline Demo Successful" in stdout_content:
+            if stdout_sink.hit:
                 print("✅ Demo completed full workflow")
             return True
             
@@ -141,12 +246,17 @@ def main():
     print("=" * 60)
     
     results = []
-    
-    # 1. Check that pytest is installed
-    results.append(run_command(
-        "python -m pytest --version",
-        "Check pytest installation"
-    ))
+
+    # 1. Check that pytest is installed - an import answers this
+    # without paying an interpreter cold start
+    print("\n🔍 Check pytest installation")
+    try:
+        import pytest
+        print(f"✅ SUCCESS (pytest {pytest.__version__})")
+        results.append(True)
+    except ImportError:
+        print("❌ FAILED: pytest is not installed")
+        results.append(False)
     
     # 2. Check that imports work - use direct test instead of subprocess
     print("\n🔍 Verify source code imports")
@@ -154,15 +264,22 @@ def main():
     import_result = test_direct_import()
     results.append(import_result)
     
-    # 3. Run structure tests (these should work)
-    results.append(run_command(
-        "python -m pytest tests/test_handler_structure.py -v",
+    # 3. Run structure tests (these should work) - in-process, so the
+    # check skips a fresh interpreter plus pytest import each time
+    results.append(run_pytest(
+        ["tests/test_handler_structure.py", "-v"],
         "Run handler structure tests"
     ))
-    
+
     # 4. Run simple tests that don't require imports
-    results.append(run_command(
-        "python -m pytest tests/test_bedrock_simple.py tests/test_bedrock_validation.py tests/test_error_scenarios.py tests/test_integration_simple.py -v",
+    results.append(run_pytest(
+        [
+            "tests/test_bedrock_simple.py",
+            "tests/test_bedrock_validation.py",
+            "tests/test_error_scenarios.py",
+            "tests/test_integration_simple.py",
+            "-v",
+        ],
         "Run tests without import dependencies"
     ))
     
@@ -173,16 +290,10 @@ def main():
     results.append(demo_result)
     
     # 6. Check code formatting (if black is available)
-    results.append(run_command(
-        "black --check src/ tests/ examples/ --diff",
-        "Check code formatting with black"
-    ))
-    
+    results.append(run_black_check("Check code formatting with black"))
+
     # 7. Check code style (if flake8 is available)
-    results.append(run_command(
-        "flake8 src/ tests/ examples/ --count --select=E9,F63,F7,F82 --show-source --statistics",
-        "Check critical code style issues"
-    ))
+    results.append(run_flake8_check("Check critical code style issues"))
     
     # Summary
     print("\n" + "=" * 60)
@@ -3,27 +3,147 @@ Bedrock client for AI-powered resume analysis against job descriptions
 """
 
 import boto3
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError, BotoCoreError
 
+try:
+    # orjson (de)serializes the multi-KB model payloads several times
+    # faster than stdlib json; its dumps returns bytes, which Bedrock
+    # accepts as a request body, and its JSONDecodeError subclasses the
+    # stdlib one so the except clauses below cover both
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Decodes the first JSON object embedded in model output in one pass.
+# raw_decode stops at the object's true end, so surrounding prose and
+# braces inside JSON strings can't corrupt the slice the way a
+# find('{')/rfind('}') scan could, and the second full-string scan
+# disappears.
+_JSON_DECODER = json.JSONDecoder()
+
+# Static analysis instructions, shared verbatim by every analysis call.
+# Kept at module scope so the Converse cache checkpoint after each one
+# covers an identical prefix across calls (Bedrock skips the checkpoint
+# silently if the section is below the model's minimum cacheable token
+# count).
+#
+# The analysis is decomposed into three independent sub-prompts that run
+# concurrently - each asks for a small slice of the schema, so every
+# sub-call decodes a few hundred output tokens instead of one 2000-token
+# completion, and the three generations overlap in wall time.
+_KEYWORD_INSTRUCTIONS = """You are an expert ATS (Applicant Tracking System) analyzer. Compare the provided resume against the job description and identify the keywords and skills the resume is missing.
+
+Return your analysis in the following JSON format:
+
+{
+  "missing_keywords": ["keyword1", "keyword2", "keyword3"],
+  "missing_skills": {
+    "technical": ["skill1", "skill2"],
+    "soft": ["skill1", "skill2"]
+  }
+}
+
+Guidelines:
+- Focus on keywords and skills explicitly mentioned in the job description
+- Consider both technical skills and soft skills
+- Return ONLY the JSON response, no additional text"""
+
+_SUGGESTION_INSTRUCTIONS = """You are an expert ATS (Applicant Tracking System) analyzer. Compare the provided resume against the job description and recommend improvements.
+
+Return your analysis in the following JSON format:
+
+{
+  "suggestions": [
+    "Specific actionable suggestion 1",
+    "Specific actionable suggestion 2",
+    "Specific actionable suggestion 3"
+  ],
+  "compatibility_score": 75
+}
+
+Guidelines:
+- Provide at least 3 actionable suggestions for improvement
+- Score compatibility from 0-100 based on keyword/skill alignment
+- Be specific and practical in suggestions
+- Return ONLY the JSON response, no additional text"""
+
+_STRENGTHS_INSTRUCTIONS = """You are an expert ATS (Applicant Tracking System) analyzer. Compare the provided resume against the job description and assess how the candidate presents.
+
+Return your analysis in the following JSON format:
+
+{
+  "strengths": ["strength1", "strength2"],
+  "areas_for_improvement": ["area1", "area2"]
+}
+
+Guidelines:
+- Focus on qualifications relevant to the job description
+- Be specific and practical
+- Return ONLY the JSON response, no additional text"""
+
+_SUBPROMPT_INSTRUCTIONS = (
+    _KEYWORD_INSTRUCTIONS,
+    _SUGGESTION_INSTRUCTIONS,
+    _STRENGTHS_INSTRUCTIONS,
+)
+
 
 class BedrockClient:
-    def __init__(self):
-        """Initialize Bedrock client"""
-        self.bedrock = boto3.client("bedrock-runtime")
+    def __init__(
+        self,
+        config=None,
+        prompt_caching=True,
+        latency_optimized=True,
+        analysis_cache=None,
+    ):
+        """Initialize Bedrock client
+
+        Args:
+            config (botocore.config.Config, optional): Client configuration
+                (timeouts, retries, connection pooling) for callers that
+                need non-default behavior, e.g. long-prompt analyses.
+            prompt_caching (bool): Insert Converse cache checkpoints so
+                repeated instruction/JD prefixes are reused across calls.
+                Disable for models without caching support.
+            latency_optimized (bool): Request latency-optimized inference
+                (performanceConfig) when prompt caching is not in use.
+                Bedrock rejects requests combining the two, so caching
+                takes precedence while enabled.
+            analysis_cache (DynamoDBClient, optional): Cache consulted
+                before calling Bedrock when the caller supplies a file
+                hash - repeat (resume, JD) pairs become one DynamoDB
+                read instead of a multi-second model call.
+        """
+        if config is not None:
+            self.bedrock = boto3.client("bedrock-runtime", config=config)
+        else:
+            self.bedrock = boto3.client("bedrock-runtime")
         # Using Amazon Nova Lite inference profile
         self.model_id = "apac.amazon.nova-lite-v1:0"
+        self.prompt_caching = prompt_caching
+        self.latency_optimized = latency_optimized
+        self.analysis_cache = analysis_cache
 
-    def analyze_resume_vs_job_description(self, resume_text, job_description):
+    def analyze_resume_vs_job_description(
+        self, resume_text, job_description, file_hash=None
+    ):
         """
         Analyze resume against job description using Bedrock AI
 
         Args:
             resume_text (str): Extracted text from resume PDF
             job_description (str): Job description text
+            file_hash (str, optional): SHA-256 hash of the resume file,
+                used with the analysis cache to serve repeat
+                (resume, job description) pairs without calling Bedrock
 
         Returns:
             dict: Contains 'success' boolean and either analysis results or 'error' message
@@ -39,56 +159,75 @@ class BedrockClient:
                     "error": "Job description is empty or invalid",
                 }
 
-            # Create structured prompt for analysis
-            prompt = self._create_analysis_prompt(resume_text, job_description)
-
-            # Prepare request body for Nova Pro
-            request_body = {
-                "messages": [{"role": "user", "content": [{"text": prompt}]}],
-                "inferenceConfig": {
-                    "max_new_tokens": 2000,
-                    "temperature": 0.1,
-                    "top_p": 0.9,
-                },
-            }
+            # A cached analysis for this exact pair makes the whole
+            # call a single ~5ms DynamoDB read
+            cache_key = None
+            if file_hash and self.analysis_cache is not None:
+                jd_digest = hashlib.sha256(
+                    job_description.encode("utf-8")
+                ).hexdigest()
+                cache_key = hashlib.sha256(
+                    f"{file_hash}|{jd_digest}".encode("utf-8")
+                ).hexdigest()
+                cached = self.analysis_cache.get_analysis_cache(cache_key)
+                if cached is not None:
+                    logger.info("Serving analysis from cache")
+                    return {"success": True, "analysis": cached}
 
             logger.info("Sending analysis request to Bedrock")
 
-            # Call Bedrock
-            response = self.bedrock.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body),
-                contentType="application/json",
-                accept="application/json",
-            )
-
-            # Parse response
-            response_body = json.loads(response["body"].read())
-
-            # Extract content from Nova Pro response
-            if "output" in response_body and "message" in response_body["output"]:
-                message = response_body["output"]["message"]
-                if "content" in message and len(message["content"]) > 0:
-                    analysis_text = message["content"][0]["text"]
-
-                    # Parse the JSON analysis from the response
-                    analysis_result = self._parse_analysis_response(analysis_text)
+            # Fire the three sub-prompts concurrently - they share the
+            # resume/JD inputs but are otherwise independent, so the
+            # whole analysis finishes in the time of the slowest slice
+            with ThreadPoolExecutor(
+                max_workers=len(_SUBPROMPT_INSTRUCTIONS)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._converse_analysis,
+                        instructions,
+                        resume_text,
+                        job_description,
+                    )
+                    for instructions in _SUBPROMPT_INSTRUCTIONS
+                ]
+                texts = [future.result() for future in futures]
+
+            if any(text is None for text in texts):
+                return {
+                    "success": False,
+                    "error": "Invalid response format from AI model",
+                }
 
-                    if analysis_result["success"]:
-                        logger.info("Successfully completed resume analysis")
-                        return {"success": True, "analysis": analysis_result["data"]}
-                    else:
-                        return analysis_result
-                else:
+            # Merge the sub-prompt JSON fragments into one analysis;
+            # each sub-prompt owns a disjoint slice of the schema
+            merged = {}
+            for text in texts:
+                start_idx = text.find("{")
+                if start_idx == -1:
                     return {
                         "success": False,
-                        "error": "Invalid response format from AI model",
+                        "error": "No valid JSON found in AI response",
                     }
+                fragment, _ = _JSON_DECODER.raw_decode(text, start_idx)
+                merged.update(fragment)
+
+            # Run the merged analysis through the shared validation
+            analysis_result = self._parse_analysis_response(json.dumps(merged))
+
+            if analysis_result["success"]:
+                logger.info("Successfully completed resume analysis")
+                if cache_key is not None:
+                    self.analysis_cache.put_analysis_cache(
+                        cache_key, analysis_result["data"]
+                    )
+                return {"success": True, "analysis": analysis_result["data"]}
             else:
-                return {
-                    "success": False,
-                    "error": "Invalid response format from AI model",
-                }
+                return analysis_result
+
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parsing error: {e}")
+            return {"success": False, "error": "Invalid JSON format in AI response"}
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -134,6 +273,157 @@ class BedrockClient:
                 "error": "Analysis failed due to unexpected error.",
             }
 
+    def _converse_analysis(
+        self, instructions, resume_text, job_description, max_tokens=600
+    ):
+        """
+        Run one analysis sub-prompt and return the response text
+
+        Converse with cache checkpoints: the instructions and the job
+        description repeat verbatim across calls, so Bedrock reuses
+        their processed prefix instead of re-evaluating the full prompt
+        each time. The tight max_tokens fits the sub-prompt's slice of
+        the schema - decode latency and billing scale with output
+        tokens, so three short completions beat one long one.
+
+        Args:
+            instructions (str): System instructions for this sub-prompt
+            resume_text (str): Extracted text from resume PDF
+            job_description (str): Job description text
+            max_tokens (int): Completion budget for this sub-prompt
+
+        Returns:
+            str: Response text, or None on an unexpected response shape
+        """
+        if self.prompt_caching:
+            system = [
+                {"text": instructions},
+                {"cachePoint": {"type": "default"}},
+            ]
+            content = [
+                {"text": f"Job Description:\n{job_description}"},
+                {"cachePoint": {"type": "default"}},
+                {"text": f"Resume Text:\n{resume_text}"},
+            ]
+        else:
+            system = [{"text": instructions}]
+            content = [
+                {"text": f"Job Description:\n{job_description}"},
+                {"text": f"Resume Text:\n{resume_text}"},
+            ]
+
+        request = {
+            "modelId": self.model_id,
+            "system": system,
+            "messages": [{"role": "user", "content": content}],
+            "inferenceConfig": {
+                "maxTokens": max_tokens,
+                "temperature": 0.1,
+                "topP": 0.9,
+            },
+        }
+
+        # Latency-optimized inference only applies on the non-cached
+        # path - Bedrock rejects it alongside cache checkpoints
+        if self.latency_optimized and not self.prompt_caching:
+            request["performanceConfig"] = {"latency": "optimized"}
+
+        response_body = self.bedrock.converse(**request)
+
+        if "output" in response_body and "message" in response_body["output"]:
+            message = response_body["output"]["message"]
+            if "content" in message and len(message["content"]) > 0:
+                return message["content"][0]["text"]
+        return None
+
+    def analyze_batch(self, pairs, max_concurrency=50):
+        """
+        Analyze multiple resume/job-description pairs concurrently
+
+        The per-pair analyses are independent network calls, so a batch
+        of N completes in roughly the time of the slowest call instead
+        of the sum of all N. The shared client (botocore clients are
+        thread-safe) amortizes TLS handshakes across the batch; callers
+        issuing large batches should pass a Config with a bigger
+        max_pool_connections so calls don't serialize on the default
+        pool of 10.
+
+        Args:
+            pairs (list): (resume_text, job_description) tuples
+            max_concurrency (int): Upper bound on in-flight Bedrock
+                calls, to stay inside the account's TPS quota
+
+        Returns:
+            list: Per-pair result dicts in input order; failures come
+                back as the usual {'success': False, 'error': ...}
+        """
+        if not pairs:
+            return []
+
+        workers = min(max_concurrency, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.analyze_resume_vs_job_description,
+                    resume_text,
+                    job_description,
+                )
+                for resume_text, job_description in pairs
+            ]
+            return [future.result() for future in futures]
+
+    def analyze_stream(self, resume_text, job_description):
+        """
+        Stream the resume analysis, yielding text chunks as generated
+
+        Streaming drops time-to-first-byte from full completion time to
+        roughly the first token, so callers can show progress (or fail
+        fast) while the model is still generating. Callers accumulate
+        the chunks and parse the final JSON themselves, e.g. via
+        analyze_resume_vs_job_description for the blocking equivalent.
+
+        Args:
+            resume_text (str): Extracted text from resume PDF
+            job_description (str): Job description text
+
+        Yields:
+            str: Incremental pieces of the analysis response text
+
+        Raises:
+            ValueError: If either input is empty or invalid
+        """
+        if not resume_text or not resume_text.strip():
+            raise ValueError("Resume text is empty or invalid")
+
+        if not job_description or not job_description.strip():
+            raise ValueError("Job description is empty or invalid")
+
+        prompt = self._create_analysis_prompt(resume_text, job_description)
+
+        request_body = {
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+            "inferenceConfig": {
+                "max_new_tokens": 2000,
+                "temperature": 0.1,
+                "top_p": 0.9,
+            },
+        }
+
+        logger.info("Sending streaming analysis request to Bedrock")
+
+        response = self.bedrock.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            body=_json_dumps(request_body),
+            contentType="application/json",
+            accept="application/json",
+        )
+
+        for event in response["body"]:
+            chunk = _json_loads(event["chunk"]["bytes"])
+            delta = chunk.get("contentBlockDelta", {}).get("delta", {})
+            if delta.get("text"):
+                yield delta["text"]
+
     def _create_analysis_prompt(self, resume_text, job_description):
         """
         Create structured prompt for resume analysis
@@ -192,18 +482,13 @@ Guidelines:
             dict: Parsed analysis data or error information
         """
         try:
-            # Clean the response text to extract JSON
-            response_text = response_text.strip()
-
             # Find JSON content (handle cases where model adds extra text)
             start_idx = response_text.find("{")
-            end_idx = response_text.rfind("}") + 1
 
-            if start_idx == -1 or end_idx == 0:
+            if start_idx == -1:
                 return {"success": False, "error": "No valid JSON found in AI response"}
 
-            json_text = response_text[start_idx:end_idx]
-            analysis_data = json.loads(json_text)
+            analysis_data, _ = _JSON_DECODER.raw_decode(response_text, start_idx)
 
             # Validate required fields
             required_fields = [
@@ -284,12 +569,12 @@ Guidelines:
 
             response = self.bedrock.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(request_body),
+                body=_json_dumps(request_body),
                 contentType="application/json",
                 accept="application/json",
             )
 
-            response_body = json.loads(response["body"].read())
+            response_body = _json_loads(response["body"].read())
 
             if "output" in response_body and "message" in response_body["output"]:
                 message = response_body["output"]["message"]
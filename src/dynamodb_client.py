@@ -4,14 +4,20 @@ Provides basic put and get operations for the resume cache table.
 """
 
 import boto3
+import json
 import os
 import time
-from typing import Optional, Dict, Any
+from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Partition prefix separating analysis-cache items from resume-cache
+# items in the shared table (resume hashes are bare hex, so the prefix
+# cannot collide)
+_ANALYSIS_PREFIX = 'A#'
+
 class DynamoDBClient:
     """DynamoDB client wrapper for resume cache operations."""
     
@@ -22,6 +28,20 @@ class DynamoDBClient:
         if not self.table_name:
             raise ValueError("RESUME_CACHE_TABLE environment variable not set")
         self.table = self.dynamodb.Table(self.table_name)
+        # Low-level client for batch reads, built on first use
+        self._dynamodb_low = None
+        # In-process cache of known items. Only hits and our own writes
+        # are cached - a miss must stay uncached so a later put by this
+        # or another worker is still observed. Items are immutable by
+        # hash, so hits never go stale within a worker's lifetime.
+        self._local_cache: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def _low_client(self):
+        """Low-level DynamoDB client, created lazily for batch_get_item."""
+        if self._dynamodb_low is None:
+            self._dynamodb_low = boto3.client('dynamodb')
+        return self._dynamodb_low
     
     def put_resume_cache(self, file_hash: str, extracted_text: str, original_filename: str, ttl_hours: int = 12) -> bool:
         """
@@ -48,6 +68,7 @@ class DynamoDBClient:
             }
             
             self.table.put_item(Item=item)
+            self._local_cache[file_hash] = item
             logger.info(f"Successfully stored resume cache for hash: {file_hash[:8]}...")
             return True
             
@@ -68,20 +89,30 @@ class DynamoDBClient:
         Returns:
             Dict containing cache data if found, None otherwise
         """
+        # Repeat lookups in the same worker (cache_exists after a
+        # deduplication check, warm Lambda invocations) skip the
+        # network round trip entirely
+        cached = self._local_cache.get(file_hash)
+        if cached is not None:
+            logger.info(f"Found cached resume for hash: {file_hash[:8]}... (local)")
+            return dict(cached)
+
         try:
             response = self.table.get_item(
                 Key={'file_hash': file_hash}
             )
-            
+
             if 'Item' in response:
                 item = response['Item']
                 logger.info(f"Found cached resume for hash: {file_hash[:8]}...")
-                return {
+                result = {
                     'file_hash': item['file_hash'],
                     'extracted_text': item['extracted_text'],
                     'original_filename': item['original_filename'],
                     'ttl': item['ttl']
                 }
+                self._local_cache[file_hash] = dict(result)
+                return result
             else:
                 logger.info(f"No cached resume found for hash: {file_hash[:8]}...")
                 return None
@@ -93,6 +124,127 @@ class DynamoDBClient:
             logger.error(f"Unexpected error retrieving resume cache: {e}")
             return None
     
+    def get_resume_cache_batch(self, file_hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve resume cache data for many hashes in bulk.
+
+        BatchGetItem reads up to 100 keys per round trip, so a bulk
+        ingest costs one network call per 100 hashes instead of one
+        per hash. Hashes already known locally are served without any
+        network call at all.
+
+        Args:
+            file_hashes: SHA-256 hashes of the file contents
+
+        Returns:
+            Dict mapping each found hash to its cache data; hashes with
+            no cached item are absent from the result
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for file_hash in dict.fromkeys(file_hashes):
+            cached = self._local_cache.get(file_hash)
+            if cached is not None:
+                results[file_hash] = dict(cached)
+            else:
+                to_fetch.append(file_hash)
+
+        try:
+            for i in range(0, len(to_fetch), 100):
+                chunk = to_fetch[i:i + 100]
+                request = {
+                    self.table_name: {
+                        'Keys': [{'file_hash': {'S': h}} for h in chunk]
+                    }
+                }
+                # DynamoDB may return a partial batch under load; keep
+                # re-requesting whatever came back unprocessed
+                while request:
+                    response = self._low_client.batch_get_item(RequestItems=request)
+                    for item in response.get('Responses', {}).get(self.table_name, []):
+                        data = {
+                            'file_hash': item['file_hash']['S'],
+                            'extracted_text': item['extracted_text']['S'],
+                            'original_filename': item['original_filename']['S'],
+                            'ttl': int(item['ttl']['N'])
+                        }
+                        self._local_cache[data['file_hash']] = dict(data)
+                        results[data['file_hash']] = data
+                    request = response.get('UnprocessedKeys') or None
+
+            logger.info(f"Batch lookup found {len(results)} of {len(file_hashes)} hashes")
+            return results
+
+        except ClientError as e:
+            logger.error(f"Error batch retrieving resume cache: {e}")
+            return results
+        except Exception as e:
+            logger.error(f"Unexpected error batch retrieving resume cache: {e}")
+            return results
+
+    def put_analysis_cache(self, cache_key: str, analysis: Dict[str, Any], ttl_hours: int = 24) -> bool:
+        """
+        Store a completed Bedrock analysis in DynamoDB.
+
+        Args:
+            cache_key: Hash identifying the (resume, job description) pair
+            analysis: Analysis data returned by Bedrock
+            ttl_hours: Number of hours before the item expires (default: 24)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            ttl_timestamp = int(time.time()) + (ttl_hours * 60 * 60)
+
+            # Serialized as JSON: the analysis contains float scores,
+            # which DynamoDB maps reject
+            item = {
+                'file_hash': _ANALYSIS_PREFIX + cache_key,
+                'analysis': json.dumps(analysis),
+                'ttl': ttl_timestamp
+            }
+
+            self.table.put_item(Item=item)
+            logger.info(f"Successfully stored analysis cache for key: {cache_key[:8]}...")
+            return True
+
+        except ClientError as e:
+            logger.error(f"Error storing analysis cache: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error storing analysis cache: {e}")
+            return False
+
+    def get_analysis_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a cached Bedrock analysis from DynamoDB.
+
+        Args:
+            cache_key: Hash identifying the (resume, job description) pair
+
+        Returns:
+            Dict containing the analysis data if found, None otherwise
+        """
+        try:
+            response = self.table.get_item(
+                Key={'file_hash': _ANALYSIS_PREFIX + cache_key}
+            )
+
+            if 'Item' in response:
+                logger.info(f"Found cached analysis for key: {cache_key[:8]}...")
+                return json.loads(response['Item']['analysis'])
+            else:
+                logger.info(f"No cached analysis found for key: {cache_key[:8]}...")
+                return None
+
+        except ClientError as e:
+            logger.error(f"Error retrieving analysis cache: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving analysis cache: {e}")
+            return None
+
     def cache_exists(self, file_hash: str) -> bool:
         """
         Check if a resume cache exists for the given file hash.
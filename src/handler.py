@@ -12,11 +12,70 @@ from bedrock_client import BedrockClient
 from report_generator import ReportGenerator
 from deduplication_service import DeduplicationService
 from enhanced_resume_generator import EnhancedResumeGenerator
+from botocore.config import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Service clients, built lazily and reused across warm Lambda
+# invocations. Constructing them per request pays botocore's
+# credential resolution and endpoint/service-model loading every
+# call; a warm container skips all of it.
+_SERVICES = None
+_COMPREHEND = None
+
+# The analysis fans out concurrent Bedrock calls (sub-prompts,
+# batches) that would serialize on botocore's default pool of 10
+_BEDROCK_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 2, "mode": "adaptive"},
+)
+
+
+def _get_services():
+    """Build the shared service clients on first use
+
+    Returns:
+        tuple: (s3_handler, textract_client, bedrock_client,
+            report_generator, deduplication_service)
+    """
+    global _SERVICES
+    if _SERVICES is None:
+        s3_handler = S3Handler()
+        textract_client = TextractClient()
+        report_generator = ReportGenerator()
+        deduplication_service = DeduplicationService()
+        bedrock_client = BedrockClient(
+            config=_BEDROCK_CONFIG,
+            analysis_cache=deduplication_service.dynamodb_client,
+        )
+        _SERVICES = (
+            s3_handler,
+            textract_client,
+            bedrock_client,
+            report_generator,
+            deduplication_service,
+        )
+    return _SERVICES
+
+
+def _get_comprehend():
+    """Build the Comprehend client on first use"""
+    global _COMPREHEND
+    if _COMPREHEND is None:
+        import boto3
+
+        _COMPREHEND = boto3.client('comprehend')
+    return _COMPREHEND
+
+
+def _reset_services():
+    """Drop the cached clients (tests re-mock boto3 between cases)"""
+    global _SERVICES, _COMPREHEND
+    _SERVICES = None
+    _COMPREHEND = None
+
 
 def apply_pii_redaction_to_text(text):
     """
@@ -29,17 +88,16 @@ def apply_pii_redaction_to_text(text):
         dict: Contains 'success', 'text', and 'redacted' status
     """
     try:
-        import boto3
         from botocore.exceptions import ClientError
-        
+
         # Only apply redaction if text contains potential PII patterns
         if not text or len(text.strip()) < 10:
             return {"success": True, "text": text, "redacted": False}
         
         # Check if Comprehend is available
         try:
-            comprehend = boto3.client('comprehend')
-            
+            comprehend = _get_comprehend()
+
             # Detect PII entities
             response = comprehend.detect_pii_entities(
                 Text=text[:5000],  # Limit to first 5000 chars for API limits
@@ -112,12 +170,14 @@ def lambda_handler(event, context):
         if not validation_result["valid"]:
             return create_error_response(400, validation_result["error"])
 
-        # Initialize all clients
-        s3_handler = S3Handler()
-        textract_client = TextractClient()
-        bedrock_client = BedrockClient()
-        report_generator = ReportGenerator()
-        deduplication_service = DeduplicationService()
+        # Initialize all clients (reused across warm invocations)
+        (
+            s3_handler,
+            textract_client,
+            bedrock_client,
+            report_generator,
+            deduplication_service,
+        ) = _get_services()
 
         # Route to appropriate handler based on event type
         event_type = validation_result["event_type"]
@@ -287,10 +347,10 @@ def handle_complete_pipeline(
             
             processing_status = "processed"
 
-        # Step 3: AI analysis using Bedrock
+        # Step 3: AI analysis using Bedrock (cached per resume/JD pair)
         logger.info("Step 3: Performing AI analysis")
         analysis_result = bedrock_client.analyze_resume_vs_job_description(
-            extracted_text, job_description
+            extracted_text, job_description, file_hash=dedup_result.get("file_hash")
         )
         if not analysis_result["success"]:
             return create_error_response(
@@ -768,12 +828,14 @@ def handle_analyze_endpoint(event):
         job_description = form_data["job_description"]
         original_filename = form_data["original_filename"]
         
-        # Initialize clients
-        s3_handler = S3Handler()
-        textract_client = TextractClient()
-        bedrock_client = BedrockClient()
-        report_generator = ReportGenerator()
-        deduplication_service = DeduplicationService()
+        # Initialize clients (reused across warm invocations)
+        (
+            s3_handler,
+            textract_client,
+            bedrock_client,
+            report_generator,
+            deduplication_service,
+        ) = _get_services()
         
         # Check for file deduplication BEFORE uploading to S3
         logger.info("Checking for file deduplication based on content hash")
@@ -830,10 +892,10 @@ def handle_analyze_endpoint(event):
             
             processing_status = "processed"
         
-        # Perform AI analysis
+        # Perform AI analysis (cached per resume/JD pair)
         logger.info("Performing AI analysis")
         analysis_result = bedrock_client.analyze_resume_vs_job_description(
-            extracted_text, job_description
+            extracted_text, job_description, file_hash=content_hash
         )
         
         if not analysis_result["success"]:
@@ -112,24 +112,14 @@ class TestBedrockClient:
         mock_bedrock = Mock()
         mock_boto3.return_value = mock_bedrock
 
-        # Create a proper mock response
-        mock_response_body = MagicMock()
-        mock_response_body.read.return_value = json.dumps(SAMPLE_BEDROCK_RESPONSE).encode()
-        
-        mock_response = MagicMock()
-        mock_response.__getitem__.return_value = mock_response_body
-        
-        # Construct the expected nested structure
-        expected_response = {
+        # Converse returns the parsed structure directly (no body stream)
+        mock_bedrock.converse.return_value = {
             "output": {
                 "message": {
                     "content": [{"text": json.dumps(SAMPLE_BEDROCK_RESPONSE)}]
                 }
             }
         }
-        mock_response_body.read.return_value = json.dumps(expected_response).encode()
-        
-        mock_bedrock.invoke_model.return_value = mock_response
 
         mock_parse.return_value = {
             "success": True,
@@ -162,6 +152,222 @@ class TestBedrockClient:
         assert "missing_keywords" in result["analysis"]
         assert "compatibility_score" in result["analysis"]
 
+    @patch("src.bedrock_client.boto3.client")
+    def test_latency_optimized_without_caching(self, mock_boto3):
+        """Test non-cached analyses request latency-optimized inference"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        mock_bedrock.converse.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {"text": SAMPLE_BEDROCK_RESPONSE["content"][0]["text"]}
+                    ]
+                }
+            }
+        }
+
+        client = BedrockClient(prompt_caching=False)
+        result = client.analyze_resume_vs_job_description(
+            SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION
+        )
+
+        assert result["success"] is True
+        request = mock_bedrock.converse.call_args.kwargs
+        assert request["performanceConfig"] == {"latency": "optimized"}
+        # Cache checkpoints and performanceConfig are mutually exclusive
+        assert all("cachePoint" not in block for block in request["system"])
+        assert all(
+            "cachePoint" not in block
+            for block in request["messages"][0]["content"]
+        )
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_cached_analysis_omits_performance_config(self, mock_boto3):
+        """Test the default cached path never sends performanceConfig"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        mock_bedrock.converse.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {"text": SAMPLE_BEDROCK_RESPONSE["content"][0]["text"]}
+                    ]
+                }
+            }
+        }
+
+        client = BedrockClient()
+        client.analyze_resume_vs_job_description(
+            SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION
+        )
+
+        request = mock_bedrock.converse.call_args.kwargs
+        assert "performanceConfig" not in request
+        assert {"cachePoint": {"type": "default"}} in request["system"]
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_decomposed_analysis_merges_fragments(self, mock_boto3):
+        """Test the three sub-prompt responses merge into one analysis"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        fragments = [
+            {
+                "missing_keywords": ["AWS", "Docker", "Kubernetes"],
+                "missing_skills": {"technical": ["Docker"], "soft": ["leadership"]},
+            },
+            {
+                "suggestions": [
+                    "Add AWS experience",
+                    "Include Docker skills",
+                    "Highlight leadership",
+                ],
+                "compatibility_score": 65,
+            },
+            {
+                "strengths": ["Python experience"],
+                "areas_for_improvement": ["Cloud experience"],
+            },
+        ]
+        mock_bedrock.converse.side_effect = [
+            {
+                "output": {
+                    "message": {"content": [{"text": json.dumps(fragment)}]}
+                }
+            }
+            for fragment in fragments
+        ]
+
+        client = BedrockClient()
+        result = client.analyze_resume_vs_job_description(
+            SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION
+        )
+
+        assert mock_bedrock.converse.call_count == 3
+        assert result["success"] is True
+        analysis = result["analysis"]
+        assert analysis["missing_keywords"] == ["AWS", "Docker", "Kubernetes"]
+        assert len(analysis["suggestions"]) == 3
+        assert analysis["compatibility_score"] == 65
+        assert analysis["strengths"] == ["Python experience"]
+        assert analysis["areas_for_improvement"] == ["Cloud experience"]
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_analysis_cache_hit_skips_bedrock(self, mock_boto3):
+        """Test a cached analysis short-circuits the Bedrock call"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        cached_analysis = {"compatibility_score": 65, "missing_keywords": ["AWS"]}
+        mock_cache = Mock()
+        mock_cache.get_analysis_cache.return_value = cached_analysis
+
+        client = BedrockClient(analysis_cache=mock_cache)
+        result = client.analyze_resume_vs_job_description(
+            SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION, file_hash="abc123"
+        )
+
+        assert result == {"success": True, "analysis": cached_analysis}
+        mock_bedrock.converse.assert_not_called()
+        mock_cache.put_analysis_cache.assert_not_called()
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_analysis_cache_miss_stores_result(self, mock_boto3):
+        """Test a cache miss analyzes normally and stores the result"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        mock_bedrock.converse.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {"text": SAMPLE_BEDROCK_RESPONSE["content"][0]["text"]}
+                    ]
+                }
+            }
+        }
+
+        mock_cache = Mock()
+        mock_cache.get_analysis_cache.return_value = None
+
+        client = BedrockClient(analysis_cache=mock_cache)
+        result = client.analyze_resume_vs_job_description(
+            SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION, file_hash="abc123"
+        )
+
+        assert result["success"] is True
+        mock_cache.put_analysis_cache.assert_called_once()
+        cache_key, stored = mock_cache.put_analysis_cache.call_args[0]
+        assert cache_key == mock_cache.get_analysis_cache.call_args[0][0]
+        assert stored == result["analysis"]
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_analyze_batch_preserves_order(self, mock_boto3):
+        """Test batch analysis returns per-pair results in input order"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        mock_bedrock.converse.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {"text": SAMPLE_BEDROCK_RESPONSE["content"][0]["text"]}
+                    ]
+                }
+            }
+        }
+
+        client = BedrockClient()
+        results = client.analyze_batch(
+            [
+                (SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION),
+                ("", SAMPLE_JOB_DESCRIPTION),
+                (SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION),
+            ]
+        )
+
+        assert len(results) == 3
+        assert results[0]["success"] is True
+        assert results[1]["success"] is False
+        assert "Resume text is empty" in results[1]["error"]
+        assert results[2]["success"] is True
+
+    def test_analyze_batch_empty(self):
+        """Test batch analysis with no pairs"""
+        assert self.bedrock_client.analyze_batch([]) == []
+
+    @patch("src.bedrock_client.boto3.client")
+    def test_analyze_stream_yields_chunks(self, mock_boto3):
+        """Test streaming analysis yields incremental text chunks"""
+        mock_bedrock = Mock()
+        mock_boto3.return_value = mock_bedrock
+
+        events = [
+            {"chunk": {"bytes": json.dumps({"messageStart": {"role": "assistant"}}).encode()}},
+            {"chunk": {"bytes": json.dumps({"contentBlockDelta": {"delta": {"text": '{"compatibility'}}}).encode()}},
+            {"chunk": {"bytes": json.dumps({"contentBlockDelta": {"delta": {"text": '_score": 65}'}}}).encode()}},
+            {"chunk": {"bytes": json.dumps({"messageStop": {"stopReason": "end_turn"}}).encode()}},
+        ]
+        mock_bedrock.invoke_model_with_response_stream.return_value = {
+            "body": iter(events)
+        }
+
+        client = BedrockClient()
+        chunks = list(
+            client.analyze_stream(SAMPLE_RESUME_TEXT, SAMPLE_JOB_DESCRIPTION)
+        )
+
+        assert chunks == ['{"compatibility', '_score": 65}']
+        mock_bedrock.invoke_model_with_response_stream.assert_called_once()
+
+    def test_analyze_stream_empty_resume_text(self):
+        """Test streaming analysis rejects empty resume text"""
+        with pytest.raises(ValueError, match="Resume text is empty"):
+            list(self.bedrock_client.analyze_stream("", SAMPLE_JOB_DESCRIPTION))
+
     def test_empty_resume_text(self):
         """Test analysis with empty resume text"""
         result = self.bedrock_client.analyze_resume_vs_job_description(
@@ -191,8 +397,8 @@ class TestBedrockClient:
         error_response = {
             "Error": {"Code": "AccessDeniedException", "Message": "Access denied"}
         }
-        mock_bedrock.invoke_model.side_effect = ClientError(
-            error_response, "InvokeModel"
+        mock_bedrock.converse.side_effect = ClientError(
+            error_response, "Converse"
         )
 
         client = BedrockClient()
@@ -214,8 +420,8 @@ class TestBedrockClient:
         error_response = {
             "Error": {"Code": "ModelNotReadyException", "Message": "Model not ready"}
         }
-        mock_bedrock.invoke_model.side_effect = ClientError(
-            error_response, "InvokeModel"
+        mock_bedrock.converse.side_effect = ClientError(
+            error_response, "Converse"
         )
 
         client = BedrockClient()
@@ -237,8 +443,8 @@ class TestBedrockClient:
         error_response = {
             "Error": {"Code": "ThrottlingException", "Message": "Request throttled"}
         }
-        mock_bedrock.invoke_model.side_effect = ClientError(
-            error_response, "InvokeModel"
+        mock_bedrock.converse.side_effect = ClientError(
+            error_response, "Converse"
         )
 
         client = BedrockClient()
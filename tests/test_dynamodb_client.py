@@ -121,6 +121,142 @@ class TestDynamoDBClient:
             assert result is None
             mock_table.get_item.assert_called_once_with(Key={'file_hash': 'nonexistent'})
     
+    @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
+    def test_get_resume_cache_repeat_lookup_uses_local_cache(self):
+        """Test repeat lookups for the same hash skip DynamoDB."""
+        with patch('boto3.resource') as mock_resource:
+            mock_table = Mock()
+            mock_dynamodb = Mock()
+            mock_resource.return_value = mock_dynamodb
+            mock_dynamodb.Table.return_value = mock_table
+
+            client = DynamoDBClient()
+
+            mock_table.get_item.return_value = {
+                'Item': {
+                    'file_hash': 'abc123',
+                    'extracted_text': 'Sample resume text',
+                    'original_filename': 'resume.pdf',
+                    'ttl': int(time.time()) + 86400
+                }
+            }
+
+            first = client.get_resume_cache('abc123')
+            second = client.get_resume_cache('abc123')
+
+            assert first == second
+            mock_table.get_item.assert_called_once()
+
+            # Misses are not cached locally - a later put must be seen
+            mock_table.get_item.return_value = {}
+            assert client.get_resume_cache('missing') is None
+            assert client.get_resume_cache('missing') is None
+            assert mock_table.get_item.call_count == 3
+
+    @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
+    def test_get_resume_cache_batch(self):
+        """Test bulk retrieval via BatchGetItem."""
+        with patch('boto3.resource') as mock_resource, patch('boto3.client') as mock_client:
+            mock_table = Mock()
+            mock_dynamodb = Mock()
+            mock_resource.return_value = mock_dynamodb
+            mock_dynamodb.Table.return_value = mock_table
+
+            mock_low = Mock()
+            mock_client.return_value = mock_low
+            mock_low.batch_get_item.return_value = {
+                'Responses': {
+                    'test-resume-cache': [
+                        {
+                            'file_hash': {'S': 'abc123'},
+                            'extracted_text': {'S': 'Sample resume text'},
+                            'original_filename': {'S': 'resume.pdf'},
+                            'ttl': {'N': str(int(time.time()) + 86400)}
+                        }
+                    ]
+                }
+            }
+
+            client = DynamoDBClient()
+            results = client.get_resume_cache_batch(['abc123', 'missing'])
+
+            assert set(results) == {'abc123'}
+            assert results['abc123']['extracted_text'] == 'Sample resume text'
+            mock_low.batch_get_item.assert_called_once()
+            keys = mock_low.batch_get_item.call_args[1]['RequestItems']['test-resume-cache']['Keys']
+            assert keys == [{'file_hash': {'S': 'abc123'}}, {'file_hash': {'S': 'missing'}}]
+
+            # Found items are now local - a repeat single get is free
+            assert client.get_resume_cache('abc123') is not None
+            mock_table.get_item.assert_not_called()
+
+    @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
+    def test_put_analysis_cache_success(self):
+        """Test successful analysis cache storage."""
+        with patch('boto3.resource') as mock_resource:
+            mock_table = Mock()
+            mock_dynamodb = Mock()
+            mock_resource.return_value = mock_dynamodb
+            mock_dynamodb.Table.return_value = mock_table
+
+            client = DynamoDBClient()
+
+            mock_table.put_item.return_value = {}
+
+            analysis = {'compatibility_score': 65.0, 'missing_keywords': ['AWS']}
+            result = client.put_analysis_cache('key123', analysis)
+
+            assert result is True
+
+            # Verify the item structure and partition prefix
+            call_args = mock_table.put_item.call_args
+            item = call_args[1]['Item']
+            assert item['file_hash'] == 'A#key123'
+            assert isinstance(item['analysis'], str)
+            assert 'ttl' in item
+            assert isinstance(item['ttl'], int)
+
+    @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
+    def test_get_analysis_cache_found(self):
+        """Test successful analysis cache retrieval."""
+        with patch('boto3.resource') as mock_resource:
+            mock_table = Mock()
+            mock_dynamodb = Mock()
+            mock_resource.return_value = mock_dynamodb
+            mock_dynamodb.Table.return_value = mock_table
+
+            client = DynamoDBClient()
+
+            mock_table.get_item.return_value = {
+                'Item': {
+                    'file_hash': 'A#key123',
+                    'analysis': '{"compatibility_score": 65.0}',
+                    'ttl': int(time.time()) + 86400
+                }
+            }
+
+            result = client.get_analysis_cache('key123')
+
+            assert result == {'compatibility_score': 65.0}
+            mock_table.get_item.assert_called_once_with(Key={'file_hash': 'A#key123'})
+
+    @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
+    def test_get_analysis_cache_not_found(self):
+        """Test analysis cache retrieval when item not found."""
+        with patch('boto3.resource') as mock_resource:
+            mock_table = Mock()
+            mock_dynamodb = Mock()
+            mock_resource.return_value = mock_dynamodb
+            mock_dynamodb.Table.return_value = mock_table
+
+            client = DynamoDBClient()
+
+            mock_table.get_item.return_value = {}
+
+            result = client.get_analysis_cache('nonexistent')
+
+            assert result is None
+
     @patch.dict(os.environ, {'RESUME_CACHE_TABLE': 'test-resume-cache'})
     def test_cache_exists_true(self):
         """Test cache_exists returns True when cache exists."""
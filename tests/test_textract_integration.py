@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch, MagicMock
 from botocore.exceptions import ClientError
 from textract_client import TextractClient
 from s3_handler import S3Handler
-from handler import lambda_handler, handle_direct_invocation, handle_s3_upload
+from handler import lambda_handler, handle_direct_invocation, handle_s3_upload, _reset_services
 
 def test_textract_client():
     """Test TextractClient functionality with mocked AWS services"""
@@ -166,7 +166,7 @@ def test_lambda_handler():
         mock_textract = Mock()
         mock_s3 = Mock()
         mock_bedrock = Mock()
-        mock_boto3.side_effect = lambda service: {
+        mock_boto3.side_effect = lambda service, **kwargs: {
             "textract": mock_textract,
             "s3": mock_s3,
             "bedrock-runtime": mock_bedrock,
@@ -180,6 +180,8 @@ def test_lambda_handler():
         mock_validator = Mock()
         mock_validator.validate_pdf_structure.return_value = {"valid": True}
         mock_validator_class.return_value = mock_validator
+        # Clients persist across warm invocations - rebuild under this mock
+        _reset_services()
         event = {"bucket_name": "test-bucket", "s3_key": "test-resume.pdf"}
         result = lambda_handler(event, {})
         assert result["statusCode"] == 200
@@ -194,7 +196,7 @@ def test_lambda_handler():
         mock_textract = Mock()
         mock_s3 = Mock()
         mock_bedrock = Mock()
-        mock_boto3.side_effect = lambda service: {
+        mock_boto3.side_effect = lambda service, **kwargs: {
             "textract": mock_textract,
             "s3": mock_s3,
             "bedrock-runtime": mock_bedrock,
@@ -208,6 +210,7 @@ def test_lambda_handler():
         mock_validator = Mock()
         mock_validator.validate_pdf_structure.return_value = {"valid": True}
         mock_validator_class.return_value = mock_validator
+        _reset_services()
         s3_event = {
             "Records": [
                 {